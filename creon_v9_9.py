@@ -1,18 +1,29 @@
 import sys
 from typing import Optional, Tuple, Dict, List
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, QObject
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, QObject, QStringListModel, QAbstractTableModel, QModelIndex,
+    QEvent, QRect, QRunnable, QThreadPool
+)
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QPushButton, QLabel, QTableWidget,
-    QTableWidgetItem, QHeaderView, QCheckBox, QHBoxLayout, QVBoxLayout,
-    QSpinBox, QComboBox, QSplitter, QScrollArea, QFrame, QGroupBox,
-    QGridLayout, QTabWidget, QProgressBar, QTextEdit, QLineEdit,
-    QDoubleSpinBox, QSpacerItem, QSizePolicy, QMessageBox, QFileDialog,
-    QInputDialog, QCompleter, QDialog
+    QApplication, QMainWindow, QWidget, QPushButton, QLabel, QTableView,
+    QAbstractItemView, QHeaderView, QHBoxLayout, QVBoxLayout,
+    QSpinBox, QComboBox, QSplitter, QScrollArea, QGroupBox,
+    QGridLayout, QTabWidget, QProgressBar, QPlainTextEdit, QLineEdit,
+    QDoubleSpinBox, QSpacerItem, QMessageBox, QFileDialog,
+    QInputDialog, QCompleter, QDialog, QStackedWidget, QStyledItemDelegate, QStyleOptionViewItem,
+    QToolTip, QStyle
 )
-from PyQt5.QtGui import QFont, QPalette, QColor, QIcon
-from datetime import datetime
+from PyQt5.QtGui import QFont, QPalette, QColor, QIcon, QTextCharFormat, QTextCursor, QPainter, QPen, QBrush
+from datetime import datetime, timedelta, time as dt_time
 import json
+try:
+    import orjson  # 설정 파일 직렬화 가속 (없으면 표준 json 사용)
+except ImportError:
+    orjson = None
 import os
+import tempfile
+import sqlite3
+import numpy as np
 
 try:
     import win32com.client
@@ -38,18 +49,15 @@ except ImportError:
     sys.exit(1)
 import threading
 import logging
-import queue
 import time
+from collections import deque
+from functools import lru_cache
 com_lock = threading.Lock()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-
-class ComContext:
-    def __enter__(self):
-        pythoncom.CoInitialize()
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        pythoncom.CoUninitialize()
+# 틱마다 호출되는 경로용 로거 (isEnabledFor로 감싸고 %-포맷을 써서 비활성 레벨이면 문자열을 만들지 않음)
+_log = logging.getLogger(__name__)
 
 # Lock을 이용해 스레드 안전 처리
 from threading import Lock
@@ -57,71 +65,190 @@ from threading import Lock
 # COM 오류를 잡기 위한 예외 클래스
 from pywintypes import com_error
 
+def _json_dumps(obj) -> bytes:
+    """obj를 UTF-8 JSON 바이트로 직렬화합니다 (비ASCII 문자는 이스케이프하지 않음)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# 정규장 시간 (자동매매 루프가 동작하는 구간)
+MARKET_OPEN = dt_time(9, 0)
+MARKET_CLOSE = dt_time(15, 30)
+
+def _seconds_until_market_open(now: datetime) -> float:
+    """now 이후 다음 정규장 시작까지 남은 시간(초)을 반환합니다."""
+    open_at = datetime.combine(now.date(), MARKET_OPEN)
+    if now >= open_at:
+        open_at += timedelta(days=1)
+    return (open_at - now).total_seconds()
+
+def _dispatch(progid: str):
+    """COM 객체를 early-bound(makepy 래퍼)로 생성하고, 실패하면 late-bound Dispatch로 대체합니다."""
+    try:
+        return win32com.client.gencache.EnsureDispatch(progid)
+    except Exception as e:
+        logging.warning(f"{progid} early-bound 생성 실패, late-bound로 대체합니다: {e}")
+        return win32com.client.Dispatch(progid)
+
+class Tick:
+    """실시간 체결 틱 레코드 (__slots__ 고정 필드)."""
+    __slots__ = ("code", "current_price", "high_price", "low_price", "volume", "trade_value", "tick_time")
+
+    def __init__(self, code, current_price, high_price, low_price, volume, trade_value, tick_time):
+        self.code = code
+        self.current_price = current_price
+        self.high_price = high_price
+        self.low_price = low_price
+        self.volume = volume
+        self.trade_value = trade_value
+        self.tick_time = tick_time
+
+    def __repr__(self):
+        return (f"Tick(code={self.code}, current_price={self.current_price}, high_price={self.high_price}, "
+                f"low_price={self.low_price}, volume={self.volume}, trade_value={self.trade_value}, "
+                f"tick_time={self.tick_time})")
+
+def _decode_tick(code: str, ghv, mult_table: Dict[str, int]) -> Tick:
+    """StockCur 실시간 헤더 값을 거래대금 보정까지 적용한 Tick으로 변환합니다."""
+    return Tick(code, ghv(13), ghv(5), ghv(6), ghv(9), ghv(10) * mult_table.get(code, 1), ghv(18))
+
+# 천 단위 구분 정수 포맷 (실시간 경로에서 f-string 포맷 명세 해석을 반복하지 않도록 바인딩해 둠)
+_fmt_int = "{:,}".format
+
+# 수익률 표시 문자열 캐시 (소수 둘째 자리로 반올림한 값을 키로 쓰므로 스크롤/재도색 시 대부분 캐시에서 반환)
+_fmt_pnl = lru_cache(maxsize=4096)("{:+.2f}%".format)
+
+# 종목 테이블의 현재가/잔고 표시 문자열 캐시 (0 등 자주 나오는 값과 변하지 않은 시세는 재도색 시 캐시에서 반환)
+_fmt_money = lru_cache(maxsize=4096)(_fmt_int)
+
+@lru_cache(maxsize=4096)
+def _full_code(code: str) -> str:
+    """Creon 조회용 종목코드('A' 접두어 포함)를 반환합니다."""
+    return code if code[:1] == "A" else "A" + code
+
 # 교체할 클래스: CreonManager
 class CreonManager(QObject):
-    # <<< [추가] UI 업데이트를 위한 시그널
-    ui_update_signal = pyqtSignal(dict)
-
-    def _get_trade_value_corrected(self, code: str, raw_trade_value: int) -> int:
-        """
-        [수정됨] 거래대금 단위를 보정합니다.
-        실시간 이벤트 핸들러 내에서 COM 객체를 매번 생성하는 대신,
-        초기화된 객체를 사용하고 결과를 캐싱하여 안정성과 속도를 향상시킵니다.
-        """
-        # 1. 캐시에서 시장 정보 조회
-        if code in self.market_cache:
-            market = self.market_cache[code]
-        else:
-            # 2. 캐시에 없으면 스레드에 안전한 방식으로 COM 객체를 통해 조회하고 결과를 캐시에 저장
+    connected = pyqtSignal(bool, str)  # (연결 성공 여부, 계좌번호) – initialize_async 결과
+
+    MARKET_CACHE_DB = "market_cache.db"
+    MARKET_MULTIPLIER = {1: 10_000, 2: 1_000}  # 1: 코스피(거래소), 2: 코스닥 (기타 시장은 1)
+    REQUEST_CONCURRENCY = 4  # 동시에 진행할 수 있는 조회(BlockRequest) 수
+    MULTI_QUOTE_MAX = 110    # StockMst2 한 번에 조회 가능한 최대 종목 수
+
+    # 조회 종류별 StockChart 고정 입력값 (0: 종목코드, 2: 개수만 요청마다 설정)
+    CHART_PRESETS = {
+        "hl":    ((1, ord('2')),      # 기간으로 요청
+                  (3, ord('1')),
+                  (5, [2, 3]),        # 필드 코드: 고가, 저가
+                  (6, ord('D')),      # 일봉
+                  (9, ord('1'))),     # 수정주가
+    }
+
+    def _build_market_mult(self) -> Dict[str, int]:
+        """코스피/코스닥 종목 목록으로 {종목코드: 거래대금 보정 배수} 테이블을 만듭니다 (작업 스레드에서 호출)."""
+        markets = {}
+        try:
+            code_mgr = self._thread_com("code_mgr", "CpUtil.CpCodeMgr")
+            for market in self.MARKET_MULTIPLIER:
+                for c in code_mgr.GetStockListByMarket(market):
+                    markets[c] = market
+        except Exception as e:
+            logging.warning(f"시장별 종목 목록 조회 실패, 저장된 시장 구분을 사용합니다: {e}")
+            markets = {}
+
+        try:
+            conn = sqlite3.connect(self.MARKET_CACHE_DB)
             try:
-                # com_lock을 사용해 여러 스레드에서의 동시 접근을 방지합니다.
-                with com_lock:
-                    market = self.cp_code_mgr.GetMarketKind(code)
-                    self.market_cache[code] = market
-            except Exception as e:
-                logging.error(f"[{code}] 시장 구분 정보 조회 실패: {e}")
-                # 조회 실패 시 원본 값을 그대로 반환하여 오류를 방지합니다.
-                return raw_trade_value
-
-        # 3. 시장 구분에 따라 거래대금 단위 보정
-        if market == 1:       # 코스피(거래소)
-            return raw_trade_value * 10_000
-        elif market == 2:     # 코스닥
-            return raw_trade_value * 1_000
-        else:                 # 기타(K-OTC, 채권 등)
-            return raw_trade_value
+                with conn:
+                    conn.execute("CREATE TABLE IF NOT EXISTS m(code TEXT PRIMARY KEY, market INT)")
+                    saved = dict(conn.execute("SELECT code, market FROM m"))
+                    if not markets:
+                        markets = saved
+                    elif markets != saved:
+                        # 상장/폐지 등으로 목록이 바뀐 경우에만 다시 기록
+                        conn.execute("DELETE FROM m")
+                        conn.executemany("INSERT INTO m VALUES(?, ?)", markets.items())
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.warning(f"시장 구분 캐시({self.MARKET_CACHE_DB}) 처리 실패: {e}")
+
+        return {c: self.MARKET_MULTIPLIER.get(m, 1) for c, m in markets.items()}
+
+    def _load_market_mult(self):
+        """작업 스레드에서 거래대금 보정 배수 테이블을 만들어 market_mult를 교체합니다."""
+        self.enter_thread()
+        try:
+            self.market_mult = self._build_market_mult()
+        finally:
+            self.leave_thread()
+            self.market_ready.set()
 
     def __init__(self):
         super().__init__()
         self.cp_cybos = None
         self.cp_util = None
         self.cp_order = None
+        self.cp_balance = None
         self.cp_stock = None
-        self.stock_chart = None
         self.cp_code_mgr = None
         self.account = None
         self.acc_flag = None
         self.is_initialized = False
-        self.market_cache = {}
+        self.market_mult: Dict[str, int] = {}  # {종목코드: 거래대금 보정 배수}
+        self.market_ready = threading.Event()  # market_mult 로딩 완료 여부
+        self.name_cache: Dict[str, str] = {}   # {종목코드: 종목명}
+        self._all_stocks: Optional[List[Tuple[str, str]]] = None  # [(종목코드, 종목명)] 코스피+코스닥
+        self._all_stocks_date = None
+        self.completer_list: List[str] = []    # 종목 추가 자동완성용 "종목명 (종목코드)" 목록 (대소문자 무시 정렬)
+
+        # 워커 간 공유하는 N일 고점/저점 캐시 { (종목코드, N, 날짜): (고점, 저점) }
+        self._nday_cache: Dict[Tuple[str, int, str], Tuple[int, int]] = {}
+        self._nday_lock = Lock()  # 캐시 확인/삽입에만 사용 (차트 조회 중에는 잡지 않음)
+        self._nday_inflight: Dict[Tuple[str, str], threading.Event] = {}  # 조회 중인 (종목코드, 날짜)
         self.sub_lock = Lock()
+
+        # 조회용 COM 객체는 스레드별로 보관하고, 동시 조회 수만 세마포어로 제한
+        self._tls = threading.local()
+        self._request_sem = threading.BoundedSemaphore(self.REQUEST_CONCURRENCY)
+
+        # UI 반영 대기 중인 종목별 최신 틱 { stock_code: tick_data }
+        self._pending_ui: Dict[str, Tick] = {}
+        self._ui_lock = Lock()
         
         # <<< [추가] 실시간 구독 관리를 위한 딕셔너리 { stock_code: com_object }
         self.realtime_subscribers = {}
 
+        # 주문 체결 통보 구독 및 종목별 체결 대기 이벤트 { 'A'+종목코드: threading.Event }
+        self.conclusion_obj = None
+        self.conclusion_handler = None
+        self._order_events: Dict[str, threading.Event] = {}
+
     def initialize(self) -> bool:
         try:
             pythoncom.CoInitialize() # 메인 스레드 COM 초기화
-            self.cp_cybos = win32com.client.Dispatch("CpUtil.CpCybos")
+            self.cp_cybos = _dispatch("CpUtil.CpCybos")
             if self.cp_cybos.IsConnect != 1:
                 logging.error("Creon Plus에 연결되지 않았습니다.")
                 return False
 
-            self.cp_util = win32com.client.Dispatch("CpTrade.CpTdUtil")
+            self.cp_util = _dispatch("CpTrade.CpTdUtil")
             self.cp_util.TradeInit(0)
-            self.cp_order = win32com.client.Dispatch("CpTrade.CpTd0311")
-            self.cp_stock = win32com.client.Dispatch("DsCbo1.StockMst")
-            self.stock_chart = win32com.client.Dispatch("CpSysDib.StockChart")
-            self.cp_code_mgr = win32com.client.Dispatch("CpUtil.CpCodeMgr")
+            self.cp_order = _dispatch("CpTrade.CpTd0311")
+            self.cp_balance = _dispatch("CpTrade.CpTd6033")
+            self.cp_stock = _dispatch("DsCbo1.StockMst")
+            # 메인 스레드는 방금 만든 조회 객체를 스레드 전용 객체로 그대로 사용
+            self._tls.com_initialized = True
+            self._tls.cp_balance = self.cp_balance
+            self._tls.cp_stock = self.cp_stock
+            self.cp_code_mgr = _dispatch("CpUtil.CpCodeMgr")
+
+            # 거래대금 보정 배수 테이블을 한 번만 구성 (실시간 이벤트마다 COM 조회 방지)
+            # 수천 종목 조회와 캐시 DB 처리가 GUI를 막지 않도록 작업 스레드에서 수행
+            threading.Thread(target=self._load_market_mult, name="market-mult", daemon=True).start()
 
             accounts = self.cp_util.AccountNumber
             if not accounts:
@@ -134,6 +261,8 @@ class CreonManager(QObject):
                 return False
             self.acc_flag = goods_list[0]
 
+            self._subscribe_conclusion()
+
             self.is_initialized = True
             logging.info("Creon 초기화 완료")
             return True
@@ -141,8 +270,19 @@ class CreonManager(QObject):
             logging.error(f"Creon 초기화 실패: {e}")
             return False
 
+    def initialize_async(self):
+        """초기화를 다음 이벤트 루프 차례로 미루고 즉시 반환합니다. 결과는 connected 시그널로 알립니다."""
+        QTimer.singleShot(0, self._initialize_and_notify)
+
+    def _initialize_and_notify(self):
+        ok = self.initialize()
+        self.connected.emit(ok, self.account or "")
+
     # <<< [추가] 실시간 데이터 수신을 위한 이벤트 핸들러 클래스
     class CpEventClass:
+        # 틱마다 읽는 속성을 슬롯 디스크립터로 고정 (WithEvents가 만든 파생 클래스에서도
+        # 데이터 디스크립터가 인스턴스 __dict__보다 먼저 조회됨)
+        __slots__ = ('manager', 'obj')
         
         def __init__(self):
             self.manager = None
@@ -153,47 +293,90 @@ class CreonManager(QObject):
             self.manager = manager
 
         def OnReceived(self):
-            # COM 초기화/해제를 자동으로 1:1로 처리
-            with ComContext():
-                logging.info(f"[{self.obj.GetHeaderValue(0)}] OnReceived triggered")
-                try:
-                    if not self.manager:
-                        logging.error("Manager가 초기화되지 않았습니다.")
-                        return
+            # 이벤트는 구독 객체를 만든 STA 스레드(이미 CoInitialize된 메인 스레드)에서 전달되므로
+            # 틱마다 CoInitialize/CoUninitialize를 반복할 필요가 없음
+            # COM 메서드/manager 참조를 지역 변수로 한 번만 바인딩 (틱마다 동적 속성 조회 방지)
+            ghv = self.obj.GetHeaderValue
+            code = ghv(0)
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("[%s] OnReceived triggered", code)
+            try:
+                mgr = self.manager
+                if not mgr:
+                    logging.error("Manager가 초기화되지 않았습니다.")
+                    return
 
-                    code = self.obj.GetHeaderValue(0)
-                    data = {
-                        "code":          code,
-                        "current_price": self.obj.GetHeaderValue(13),
-                        "high_price":    self.obj.GetHeaderValue(5),
-                        "low_price":     self.obj.GetHeaderValue(6),
-                        "volume":        self.obj.GetHeaderValue(9),
-                        "trade_value":   self.manager._get_trade_value_corrected(
-                                            code,
-                                            self.obj.GetHeaderValue(10)
-                                        ),
-                        "tick_time":     self.obj.GetHeaderValue(18),
-                    }
-
-                    # 큐에 안전하게 삽입
-                    try:
-                        if code in self.manager.realtime_subscribers:
-                            q = self.manager.realtime_subscribers[code]['queue']
-                            q.put_nowait(data)
-                            logging.info(f"[{code}] 데이터 삽입 – 큐 사이즈: {q.qsize()}")
-                    except queue.Full:
-                        logging.warning(f"[{code}] 데이터 누락 – 큐가 가득 찼습니다.")
-
-                    # UI 업데이트
-                    self.manager.ui_update_signal.emit(data)
-
-                except com_error as ce:
-                    logging.error(f"COM 예외 발생({code}): {ce}")
-                except Exception as e:
-                    logging.error(f"실시간 데이터 처리 중 예외: {e}")
+                tick = _decode_tick(code, ghv, mgr.market_mult)
+
+                # 큐에 삽입 (단일 생산자/단일 소비자 deque: append가 원자적이라 락 불필요,
+                # 가득 차면 가장 오래된 틱이 자동으로 밀려남) 후 대기 중인 worker를 깨움
+                sub = mgr.realtime_subscribers.get(code)
+                if sub is not None:
+                    q = sub['queue']
+                    q.append(tick)
+                    if sub['event'] is not None:
+                        sub['event'].set()
+                    if _log.isEnabledFor(logging.INFO):
+                        _log.info("[%s] 데이터 삽입 – 큐 사이즈: %d", code, len(q))
+
+                # UI 업데이트용 최신 틱만 보관 (시그널 없이 덮어쓰기, MainWindow 타이머가 주기적으로 반영)
+                with mgr._ui_lock:
+                    mgr._pending_ui[code] = tick
+
+            except com_error as ce:
+                logging.error(f"COM 예외 발생({code}): {ce}")
+            except Exception as e:
+                logging.error(f"실시간 데이터 처리 중 예외: {e}")
+
+    # 주문 체결 통보(CpConclusion) 이벤트 핸들러 클래스
+    class CpConclusionEventClass:
+        __slots__ = ('manager', 'obj')
+
+        def __init__(self):
+            self.manager = None
+            self.obj     = None
+
+        def set_manager(self, manager):
+            self.manager = manager
+
+        def OnReceived(self):
+            try:
+                ghv = self.obj.GetHeaderValue
+                if ghv(14) != "1": # 1:체결, 2:확인, 3:거부, 4:접수
+                    return
+                code = _full_code(ghv(9))
+                logging.info(f"[{code}] 체결 통보 수신 – 수량: {ghv(2)}, 가격: {ghv(3)}")
+                event = self.manager._order_events.get(code)
+                if event is not None:
+                    event.set()
+            except Exception as e:
+                logging.error(f"체결 통보 처리 중 예외: {e}")
+
+    def _subscribe_conclusion(self):
+        """계좌의 주문 체결 통보를 구독합니다. 실패하면 워커는 대기 시간 후 잔고 조회로 확인합니다."""
+        try:
+            obj = _dispatch("DsCbo1.CpConclusion")
+            handler = win32com.client.WithEvents(obj, self.CpConclusionEventClass)
+            handler.obj = obj
+            handler.set_manager(self)
+            obj.Subscribe()
+            self.conclusion_obj, self.conclusion_handler = obj, handler
+            logging.info("주문 체결 통보 구독 시작")
+        except Exception as e:
+            logging.warning(f"주문 체결 통보 구독 실패: {e}")
+
+    def register_order_event(self, code: str, event: threading.Event):
+        """해당 종목 주문이 체결되면 set될 이벤트를 등록합니다."""
+        self._order_events[_full_code(code)] = event
+
+    def unregister_order_event(self, code: str, event: threading.Event):
+        # 같은 종목으로 새 워커가 이미 등록했다면 그 이벤트는 남겨 둠
+        key = _full_code(code)
+        if self._order_events.get(key) is event:
+            del self._order_events[key]
 
     # <<< [추가] 실시간 시세 구독 메소드
-    def subscribe_realtime(self, code: str, data_queue: queue.Queue) -> bool:
+    def subscribe_realtime(self, code: str, data_queue: deque, tick_event: Optional[threading.Event] = None) -> bool:
         """실시간 시세 구독을 시작합니다."""
         with self.sub_lock:
             if not self.is_initialized:
@@ -203,7 +386,7 @@ class CreonManager(QObject):
 
             try:
                 # 1) COM 객체 생성 및 이벤트 핸들러 연결
-                obj = win32com.client.Dispatch("DsCbo1.StockCur")
+                obj = _dispatch("DsCbo1.StockCur")
                 handler = win32com.client.WithEvents(obj, self.CpEventClass)
                 handler.obj = obj
                 handler.set_manager(self)
@@ -216,7 +399,8 @@ class CreonManager(QObject):
                 self.realtime_subscribers[code] = {
                     "obj": obj,
                     "handler": handler,
-                    "queue": data_queue
+                    "queue": data_queue,
+                    "event": tick_event
                 }
                 logging.info(f"[{code}] 실시간 시세 구독 시작")
 
@@ -228,139 +412,241 @@ class CreonManager(QObject):
                 logging.error(f"[{code}] 실시간 시세 구독 실패: {e}")
                 return False
 
+    def _thread_com(self, name: str, progid: str):
+        """현재 스레드 전용 COM 객체를 반환합니다 (없으면 생성)."""
+        tls = self._tls
+        obj = getattr(tls, name, None)
+        if obj is None:
+            if not getattr(tls, "com_initialized", False):
+                pythoncom.CoInitialize()
+                tls.com_initialized = True
+            obj = _dispatch(progid)
+            setattr(tls, name, obj)
+        return obj
+
+    def enter_thread(self):
+        """작업 스레드 시작 시 COM을 초기화합니다 (_thread_com이 다시 초기화하지 않도록 표시)."""
+        pythoncom.CoInitialize()
+        self._tls.com_initialized = True
+
+    def leave_thread(self):
+        """작업 스레드 종료 시 스레드 전용 COM 객체를 먼저 해제한 뒤 COM을 해제합니다."""
+        self._tls.__dict__.clear()
+        pythoncom.CoUninitialize()
+
+    def _thread_chart(self, kind: str):
+        """현재 스레드 전용, CHART_PRESETS 입력값이 설정된 StockChart 객체를 반환합니다."""
+        name = "chart_" + kind
+        chart = getattr(self._tls, name, None)
+        if chart is None:
+            chart = self._thread_com(name, "CpSysDib.StockChart")
+            for idx, value in self.CHART_PRESETS[kind]:
+                chart.SetInputValue(idx, value)
+        return chart
+
+    def take_pending_ui(self) -> Dict[str, Tick]:
+        """UI 반영 대기 중인 종목별 최신 틱을 꺼내고 비웁니다."""
+        with self._ui_lock:
+            pending, self._pending_ui = self._pending_ui, {}
+        return pending
+
     # <<< [추가] 실시간 시세 구독 해지 메소드
     def unsubscribe_realtime(self, code: str):
         with self.sub_lock:
-            if code in self.realtime_subscribers:
-                self.realtime_subscribers[code]['obj'].Unsubscribe()
-                del self.realtime_subscribers[code]
+            sub = self.realtime_subscribers.pop(code, None)
+            if sub is not None:
+                sub['obj'].Unsubscribe()
                 logging.info(f"[{code}] 실시간 시세 구독 해지")
 
     # 기존 메소드들은 그대로 유지 (get_stock_info, get_stock_name 등)
     # ... (기존 CreonManager의 다른 메소드들은 여기에 그대로 복사) ...
-    def get_safe_close_price(self, code: str, days: int = 3) -> int:
-        """전일종가가 0이면, 과거 N일간 0이 아닌 마지막 종가 반환"""
-        if not self.is_initialized:
-            return 0
-        with com_lock:
-            if not code.startswith("A"):
-                code = "A" + code
-            try:
-                self.stock_chart.SetInputValue(0, code)
-                self.stock_chart.SetInputValue(1, ord('2'))     # 기간
-                self.stock_chart.SetInputValue(2, days)         # 최근 days개
-                self.stock_chart.SetInputValue(3, ord('2'))     # 종가만
-                self.stock_chart.SetInputValue(5, [0])          # 0: 종가
-                self.stock_chart.SetInputValue(6, ord('D'))     # 일봉
-                self.stock_chart.SetInputValue(9, ord('1'))     # 수정주가
-                self.stock_chart.BlockRequest()
-                cnt = self.stock_chart.GetHeaderValue(3)
-                for i in range(cnt):
-                    close = self.stock_chart.GetDataValue(0, i)
-                    if close > 0:
-                        return close
-                return 0
-            except Exception as e:
-                logging.error(f"종가 조회 오류({code}): {e}")
-                return 0        
-
     def get_stock_name(self, code: str) -> str:
         if not self.is_initialized:
             return ""
-        return self.cp_code_mgr.CodeToName(code)
+        # 종목명은 장중에 바뀌지 않으므로 최초 1회만 COM으로 조회
+        name = self.name_cache.get(code)
+        if name is None:
+            name = self.name_cache[code] = self.cp_code_mgr.CodeToName(code)
+        return name
+
+    def get_all_stocks_cached(self) -> List[Tuple[str, str]]:
+        """코스피+코스닥 전체 (종목코드, 종목명) 목록을 하루 한 번 구성해 반환합니다 (completer_list도 갱신)."""
+        if not self.is_initialized:
+            return []
+        today = datetime.now().date()
+        if self._all_stocks is None or self._all_stocks_date != today:
+            all_codes = []
+            all_codes.extend(self.cp_code_mgr.GetStockListByMarket(1)) # KOSPI
+            all_codes.extend(self.cp_code_mgr.GetStockListByMarket(2)) # KOSDAQ
+            stocks = [(c, self.get_stock_name(c)) for c in all_codes]
+            self._all_stocks = [(c, n) for c, n in stocks if n] # Filter out empty names
+            # 자동완성 모델이 대소문자 무시 정렬을 전제로 하므로 구성할 때 한 번만 정렬
+            self.completer_list = sorted((f"{name} ({code})" for code, name in self._all_stocks), key=str.casefold)
+            self._all_stocks_date = today
+        return self._all_stocks
 
     def get_stock_info(self, code: str):
         if not self.is_initialized:
             return None
-        with com_lock:
-            if not code.startswith("A"):
-                code = "A" + code
-            self.cp_stock.SetInputValue(0, code)
-            self.cp_stock.BlockRequest()
+        with self._request_sem:
+            code = _full_code(code)
+            stock = self._thread_com("cp_stock", "DsCbo1.StockMst")
+            stock.SetInputValue(0, code)
+            stock.BlockRequest()
+            ghv = stock.GetHeaderValue
             
             # StockCur가 주는 데이터와 필드명을 최대한 일치시킴
+            current_price = ghv(11)
             return {
                 "code": code,
-                "current_price": self.cp_stock.GetHeaderValue(11),
-                "high_price": self.cp_stock.GetHeaderValue(14),
-                "low_price": self.cp_stock.GetHeaderValue(15),
-                "close_price": self.cp_stock.GetHeaderValue(11), # 종가
-                "volume": self.cp_stock.GetHeaderValue(18),       
-                "trade_value": self.cp_stock.GetHeaderValue(19)  
+                "current_price": current_price,
+                "high_price": ghv(14),
+                "low_price": ghv(15),
+                "close_price": current_price, # 종가
+                "volume": ghv(18),       
+                "trade_value": ghv(19)  
             }
 
     def get_stock_balance_and_avg_price(self, code: str) -> Tuple[int, int]:
         try:
             if not self.is_initialized: return 0, 0
             
-            with com_lock:
-                obj = win32com.client.Dispatch("CpTrade.CpTd6033")
+            # 스레드 전용 CpTd6033 객체를 재사용 (다른 스레드의 요청과 결과가 섞이지 않음)
+            with self._request_sem:
+                obj = self._thread_com("cp_balance", "CpTrade.CpTd6033")
                 obj.SetInputValue(0, self.account)
                 obj.SetInputValue(1, self.acc_flag)
                 obj.BlockRequest()
 
-            cnt = obj.GetHeaderValue(7)
-            for i in range(cnt):
-                full_code = obj.GetDataValue(12, i) # A005930
-                if code == full_code or "A" + code == full_code:
-                    qty = obj.GetDataValue(7, i)
-                    avg_price = obj.GetDataValue(17, i)
-                    return qty, avg_price
-            return 0, 0
+                cnt = obj.GetHeaderValue(7)
+                gdv = obj.GetDataValue
+                target = _full_code(code)
+                for i in range(cnt):
+                    if gdv(12, i) == target: # A005930
+                        qty = gdv(7, i)
+                        avg_price = gdv(17, i)
+                        return qty, avg_price
+                return 0, 0
         except Exception as e:
             logging.error(f"평균단가/잔고 조회 오류({code}): {e}")
             return 0, 0
 
-    def get_high_price_for_days(self, code: str, days: int) -> int:
-        """최근 N일간(당일제외) 고가 중 최고값 반환"""
-        if not self.is_initialized:
-            return 0
-        with com_lock:
-            if not code.startswith("A"):
-                code = "A" + code
-            try:
-                self.stock_chart.SetInputValue(0, code)
-                self.stock_chart.SetInputValue(1, ord('2'))     # 기간으로 요청
-                self.stock_chart.SetInputValue(2, days + 1)     # N+1개(오늘 포함)
-                self.stock_chart.SetInputValue(3, ord('1'))     # 1: 고가만
-                self.stock_chart.SetInputValue(5, [2])          # 2: 고가
-                self.stock_chart.SetInputValue(6, ord('D'))     # 일봉
-                self.stock_chart.SetInputValue(9, ord('1'))     # 수정주가
-                self.stock_chart.BlockRequest()
-                cnt = self.stock_chart.GetHeaderValue(3)
-                highs = [self.stock_chart.GetDataValue(0, i) for i in range(cnt)]
-                if len(highs) > 1:
-                    return max(highs[1:days+1])
-                return 0
-            except Exception as e:
-                logging.error(f"N일고점 조회 오류({code}): {e}")
-                return 0
-            
-    def get_low_price_for_days(self, code: str, days: int) -> int:
-        """최근 N일간(당일제외) 저가 중 최저값 반환"""
+    def get_stock_infos_bulk(self, codes: List[str]) -> Dict[str, dict]:
+        """여러 종목의 현재가를 StockMst2로 MULTI_QUOTE_MAX 종목씩 조회해 { 종목코드: 정보 } 로 반환합니다."""
+        result = {}
+        if not self.is_initialized or not codes:
+            return result
+        with self._request_sem:
+            stock = self._thread_com("cp_stock2", "DsCbo1.StockMst2")
+            for start in range(0, len(codes), self.MULTI_QUOTE_MAX):
+                # 응답 코드('A' 접두어 포함)를 요청한 코드 형식으로 되돌리기 위한 매핑
+                requested = {_full_code(c): c for c in codes[start:start + self.MULTI_QUOTE_MAX]}
+                try:
+                    stock.SetInputValue(0, ",".join(requested))
+                    stock.BlockRequest()
+                    cnt = stock.GetHeaderValue(0)
+                    gdv = stock.GetDataValue
+                    for i in range(cnt):
+                        code = requested.get(_full_code(gdv(0, i)))
+                        if code is not None:
+                            result[code] = {"code": code, "name": gdv(1, i), "current_price": gdv(3, i)}
+                except Exception as e:
+                    logging.error(f"복수 종목 현재가 조회 오류: {e}")
+        return result
+
+    def get_balance_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """계좌 잔고를 한 번 조회해 { 'A'+종목코드: (잔고수량, 평균단가) } 로 반환합니다."""
+        try:
+            if not self.is_initialized: return {}
+
+            with self._request_sem:
+                obj = self._thread_com("cp_balance", "CpTrade.CpTd6033")
+                obj.SetInputValue(0, self.account)
+                obj.SetInputValue(1, self.acc_flag)
+                obj.BlockRequest()
+
+                cnt = obj.GetHeaderValue(7)
+                gdv = obj.GetDataValue
+                return {gdv(12, i): (gdv(7, i), gdv(17, i)) for i in range(cnt)}
+        except Exception as e:
+            logging.error(f"잔고 조회 오류: {e}")
+            return {}
+
+    def get_highs_lows_history(self, code: str, rows: int) -> Optional[np.ndarray]:
+        """최근 rows일(오늘 포함, 최신순)의 [고가, 저가] 배열을 한 번의 차트 요청으로 조회합니다. 실패 시 None."""
         if not self.is_initialized:
-            return 0
-        with com_lock:
-            if not code.startswith("A"):
-                code = "A" + code
+            return None
+        full_code = _full_code(code)
+        with self._request_sem:
             try:
-                self.stock_chart.SetInputValue(0, code)
-                self.stock_chart.SetInputValue(1, ord('2'))         # 기간 기준
-                self.stock_chart.SetInputValue(2, days + 1)         # 오늘 포함 N+1일 조회
-                self.stock_chart.SetInputValue(3, ord('3'))         # 요청 필드: 저가
-                self.stock_chart.SetInputValue(5, [3])              # 필드 코드: 저가
-                self.stock_chart.SetInputValue(6, ord('D'))         # 일봉
-                self.stock_chart.SetInputValue(9, ord('1'))         # 수정주가
-                self.stock_chart.BlockRequest()
-
-                cnt = self.stock_chart.GetHeaderValue(3)
-                lows = [self.stock_chart.GetDataValue(0, i) for i in range(cnt)]
-                if len(lows) > 1:
-                    return min(lows[1:days+1])  # 오늘 제외한 N일 중 최저가
-                return 0
+                chart = self._thread_chart("hl")
+                chart.SetInputValue(0, full_code)
+                chart.SetInputValue(2, rows)
+                chart.BlockRequest()
+
+                cnt = chart.GetHeaderValue(3)
+                gdv = chart.GetDataValue
+                arr = np.empty((cnt, 2), dtype=np.int64)
+                for i in range(cnt):
+                    arr[i, 0] = gdv(0, i)                # 고가
+                    arr[i, 1] = gdv(1, i)                # 저가
+                return arr
             except Exception as e:
-                logging.error(f"N일저점 조회 오류({code}): {e}")
-                return 0            
+                logging.error(f"N일고점/저점 조회 오류({full_code}): {e}")
+                return None
+
+    @staticmethod
+    def _reduce_highs_lows(arr: Optional[np.ndarray], ns: List[int]) -> Dict[int, Tuple[int, int]]:
+        """조회한 [고가, 저가] 배열에서 N별 최근 N일(당일제외) (최고 고가, 최저 저가)를 계산합니다."""
+        if arr is None or len(arr) <= 1:
+            return {n: (0, 0) for n in ns}
+        past = arr[1:]                                   # 오늘 제외, 최신순
+        highs = np.maximum.accumulate(past[:, 0])        # highs[k]: 최근 k+1일 최고 고가
+        lows = np.minimum.accumulate(past[:, 1])         # lows[k]: 최근 k+1일 최저 저가
+        result = {}
+        for n in ns:
+            k = min(n, len(past)) - 1
+            result[n] = (int(highs[k]), int(lows[k])) if k >= 0 else (0, 0)
+        return result
+
+    def _get_cached_highs_lows(self, code: str, ns: List[int], date_str: str) -> Dict[int, Tuple[int, int]]:
+        """(종목코드, N, 날짜)별 N일 (고점, 저점)을 캐시에서 반환하고, 없는 N은 가장 큰 N 기준 한 번의 조회로 채웁니다."""
+        inflight_key = (code, date_str)
+        while True:
+            with self._nday_lock:
+                missing = sorted({n for n in ns if (code, n, date_str) not in self._nday_cache})
+                if not missing:
+                    return {n: self._nday_cache[(code, n, date_str)] for n in ns}
+                event = self._nday_inflight.get(inflight_key)
+                owner = event is None
+                if owner:
+                    event = self._nday_inflight[inflight_key] = threading.Event()
+            if owner:
+                break
+            # 같은 종목을 다른 워커가 조회 중이면 끝날 때까지 기다린 뒤 캐시를 다시 확인
+            event.wait()
+
+        try:
+            values = self._reduce_highs_lows(self.get_highs_lows_history(code, missing[-1] + 1), missing)
+            with self._nday_lock:
+                # 날짜가 바뀐 항목은 더 이상 쓰이지 않으므로 정리
+                for key in [k for k in self._nday_cache if k[2] != date_str]:
+                    del self._nday_cache[key]
+                for n, hl in values.items():
+                    self._nday_cache[(code, n, date_str)] = hl
+                return {n: self._nday_cache[(code, n, date_str)] for n in ns}
+        finally:
+            with self._nday_lock:
+                del self._nday_inflight[inflight_key]
+            event.set()
+
+    def get_cached_high_targets(self, code: str, ns: List[int], date_str: str) -> Dict[int, int]:
+        """N별 최근 N일(당일제외) 고점 { N: 고점 } (조회 실패한 N은 제외)"""
+        return {n: hl[0] for n, hl in self._get_cached_highs_lows(code, ns, date_str).items() if hl[0] > 0}
+
+    def get_cached_low_targets(self, code: str, ns: List[int], date_str: str) -> Dict[int, int]:
+        """N별 최근 N일(당일제외) 저점 { N: 저점 } (조회 실패한 N은 제외)"""
+        return {n: hl[1] for n, hl in self._get_cached_highs_lows(code, ns, date_str).items() if hl[1] > 0}
 
     def place_order(self, stock_code, qty, price, is_buy=True) -> bool:
         logging.info(f"주문 요청: {stock_code} / 수량: {qty} / 가격: {price} / {'매수' if is_buy else '매도'}")
@@ -402,18 +688,17 @@ QWidget {
     font-family: 'Malgun Gothic', 'Segoe UI', Arial, sans-serif;
     font-size: 10pt;
 }
-QTableWidget {
+QTableView {
     background-color: #2d2d2d;
-    alternate-background-color: #353535;
     gridline-color: #555555;
     selection-background-color: #094771;
     border: 1px solid #555555;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #094771;
     color: white;
 }
-QTableWidget::item:!selected {
+QTableView::item:!selected {
     color: white;
 }
 QHeaderView::section {
@@ -499,7 +784,7 @@ QProgressBar::chunk {
     background-color: #0d7377;
     border-radius: 3px;
 }
-QTextEdit {
+QPlainTextEdit {
     background-color: #2d2d2d;
     color: white;
     border: 1px solid #555555;
@@ -508,35 +793,6 @@ QTextEdit {
 QLabel {
     color: white;
 }
-QCheckBox {
-    color: white;
-}
-QCheckBox::indicator {
-    width: 16px;
-    height: 16px;
-    border-radius: 3px;
-    background-color: #404040;
-    border: 1px solid #555;
-}
-QCheckBox::indicator:checked {
-    background-color: #0d7377;
-    border: 1px solid #14a085;
-}
-/* === Styles for Buy/Sell toggles === */
-QCheckBox.buy_toggle::indicator, QCheckBox.sell_toggle::indicator {
-    width: 20px;
-    height: 20px;
-    border: 2px solid #555;
-    border-radius: 4px;
-}
-QCheckBox.buy_toggle::indicator:checked {
-    background-color: #28a745; /* Green for Buy */
-    border-color: #1e7e34;
-}
-QCheckBox.sell_toggle::indicator:checked {
-    background-color: #dc3545; /* Red for Sell */
-    border-color: #b21f2d;
-}
 QScrollBar:vertical {
     border: none;
     background: #2d2d2d;
@@ -551,16 +807,6 @@ QScrollBar::handle:vertical {
 QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
     height: 0px;
 }
-QPushButton.delete {
-    background-color: #ff5656;      /* 산뜻한 토마토 레드 */
-    color: white;
-    border: none;
-    border-radius: 4px;
-    font-size: 16px;                /* “➖” 기호가 잘 보이도록 */
-}
-QPushButton.delete:hover {
-    background-color: #ff3b3b;
-}
 """
 
 # Base classes
@@ -587,6 +833,11 @@ class _BaseStrategyRow(QWidget):
         self.lay.addStretch()
         self.lay.addWidget(self.btn_del)
 
+    def _on_strategy_changed(self, text):
+        # 위젯 재구성과 시그널 발생을 하나의 슬롯에서 처리 (콤보 변경당 슬롯 호출 1회)
+        self._update_param(text)
+        self.strategy_changed.emit()
+
     def get_config(self):
         raise NotImplementedError
 
@@ -603,8 +854,7 @@ class BuyStrategyRow(_BaseStrategyRow):
         self.lbl_strategy = QLabel("전략:")
         self.cbo_strategy = QComboBox()
         self.cbo_strategy.addItems(["N일고점돌파", "특정가격돌파"])
-        self.cbo_strategy.currentTextChanged.connect(self._update_param)
-        self.cbo_strategy.currentTextChanged.connect(self.strategy_changed.emit)
+        self.cbo_strategy.currentTextChanged.connect(self._on_strategy_changed)
         
         # Parameter
         self.lbl_param = QLabel("값:")
@@ -681,6 +931,7 @@ class BuyStrategyRow(_BaseStrategyRow):
             self.spn_cond_val.setValue(1_000_000_000)
         else:
             self.spn_cond_val.setEnabled(False)
+            self.spn_cond_val.setRange(0, 0)  # 이전 조건(거래량 등)의 범위에 값이 잘리지 않도록
             self.spn_cond_val.setSuffix("")
             self.spn_cond_val.setValue(0)
 
@@ -710,8 +961,7 @@ class SellStrategyRow(_BaseStrategyRow):
         self.lbl_strategy = QLabel("전략:")
         self.cbo_strategy = QComboBox()
         self.cbo_strategy.addItems(["N일저점이탈", "수익률매도", "손절매", "특정가격이탈", "트레일링스탑"])
-        self.cbo_strategy.currentTextChanged.connect(self._update_param)
-        self.cbo_strategy.currentTextChanged.connect(self.strategy_changed.emit)
+        self.cbo_strategy.currentTextChanged.connect(self._on_strategy_changed)
 
         # ── Single Parameter (General) ──
         self.lbl_param = QLabel("값:")
@@ -736,9 +986,17 @@ class SellStrategyRow(_BaseStrategyRow):
         self.spn_trail.setSuffix(" %")
         self.spn_trail.setDecimals(2)
 
-        # Hide initially
-        for w in (self.lbl_trail_base, self.cbo_trail_base, self.lbl_raise, self.spn_raise, self.lbl_trail, self.spn_trail): # <<< [수정] 숨길 위젯에 추가
-            w.hide()
+        # ── Parameter pages ──
+        # 전략 전환 시 위젯 6개의 표시/숨김 대신 페이지 하나만 교체 (레이아웃 재계산 1회)
+        self.page_single = self._make_param_page([(self.lbl_param, 0), (self.spn_param, 1)])
+        self.page_trail = self._make_param_page([
+            (self.lbl_trail_base, 0), (self.cbo_trail_base, 1), # <<< [추가] 기준가 위젯
+            (self.lbl_raise, 0), (self.spn_raise, 1),
+            (self.lbl_trail, 0), (self.spn_trail, 1),
+        ])
+        self.stack_param = QStackedWidget()
+        self.stack_param.addWidget(self.page_single)
+        self.stack_param.addWidget(self.page_trail)
 
         # Sell Method
         self.lbl_method = QLabel("방식:")
@@ -753,10 +1011,7 @@ class SellStrategyRow(_BaseStrategyRow):
         # Layout
         widgets = [
             (self.lbl_strategy, 0), (self.cbo_strategy, 2),
-            (self.lbl_param, 0), (self.spn_param, 1),
-            (self.lbl_trail_base, 0), (self.cbo_trail_base, 1), # <<< [추가] 레이아웃에 추가
-            (self.lbl_raise, 0), (self.spn_raise, 1),
-            (self.lbl_trail, 0), (self.spn_trail, 1),
+            (self.stack_param, 3),
             (self.lbl_method, 0), (self.cbo_method, 1),
             (self.spn_value, 2)
         ]
@@ -770,13 +1025,21 @@ class SellStrategyRow(_BaseStrategyRow):
         self._update_param(self.cbo_strategy.currentText())
         self._update_value(self.cbo_method.currentText())
 
+    @staticmethod
+    def _make_param_page(widgets):
+        page = QWidget()
+        lay = QHBoxLayout(page)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(8)
+        for widget, stretch in widgets:
+            lay.addWidget(widget)
+            lay.setStretchFactor(widget, stretch)
+        return page
+
     def _update_param(self, text):
         is_trail = (text == "트레일링스탑")
-        # Show/hide for trailing stop only
-        self.lbl_param.setVisible(not is_trail)
-        self.spn_param.setVisible(not is_trail)
-        for w in (self.lbl_trail_base, self.cbo_trail_base, self.lbl_raise, self.spn_raise, self.lbl_trail, self.spn_trail): # <<< [수정] 보이고 숨길 위젯에 추가
-            w.setVisible(is_trail)
+        # Trailing stop / single parameter page switch
+        self.stack_param.setCurrentWidget(self.page_trail if is_trail else self.page_single)
 
         if is_trail:
             self.spn_raise.setValue(3.0)   # Default raise percentage
@@ -823,6 +1086,7 @@ class SellStrategyRow(_BaseStrategyRow):
             self.spn_value.setValue(1_000_000)
         else:  # 전량
             self.spn_value.setEnabled(False)
+            self.spn_value.setRange(100, 100)  # 이전 방식(금액 등)의 범위에 값이 잘리지 않도록
             self.spn_value.setSuffix(" %") # Still show suffix for consistency even if disabled
             self.spn_value.setValue(100)
 
@@ -855,10 +1119,13 @@ class SellStrategyRow(_BaseStrategyRow):
         self.spn_value.setValue(cfg.get("value", 50))
 
 class StrategySection(QWidget):
+    ROW_POOL_MAX = 20  # 재사용을 위해 숨겨 보관하는 전략 행 위젯 최대 수
+
     def __init__(self, kind: str = "buy", parent=None):
         super().__init__(parent)
         self.kind = kind
         self.rows = []
+        self._pool = []  # 레이아웃에서 빼내 숨겨 둔 행 (set_configs에서 새로 만드는 대신 재사용)
         self._build_ui()
 
     def _build_ui(self):
@@ -898,6 +1165,15 @@ class StrategySection(QWidget):
         outer.addWidget(self.group_box)
 
     def add_row(self, cfg: Optional[dict] = None):
+        # 설정값이 주어지면 보관 중인 행을 재사용 (입력 범위는 전략/조건/방식마다 다시 설정되고, 값은 set_config가 채움)
+        # 사용자가 '추가' 버튼으로 만드는 빈 행은 기본값을 갖도록 항상 새로 생성
+        if cfg and self._pool:
+            row = self._pool.pop()
+            self.container_layout.insertWidget(self.container_layout.count() - 1, row)
+            self.rows.append(row)
+            row.set_config(cfg)
+            row.show()
+            return row
         row = BuyStrategyRow() if self.kind == "buy" else SellStrategyRow()
         # Insert before the stretch factor
         self.container_layout.insertWidget(self.container_layout.count() - 1, row)
@@ -907,11 +1183,20 @@ class StrategySection(QWidget):
             row.set_config(cfg)
         return row
 
+    def _release_row(self, row):
+        """행을 레이아웃에서 빼서 재사용 풀에 넣고, 풀이 가득 찼으면 삭제합니다."""
+        self.container_layout.removeWidget(row)
+        if len(self._pool) < self.ROW_POOL_MAX:
+            row.hide()
+            self._pool.append(row)
+        else:
+            row.setParent(None)
+            row.deleteLater() # Ensure widget is properly deleted
+
     def remove_row(self, row):
         if row in self.rows:
             self.rows.remove(row)
-            row.setParent(None)
-            row.deleteLater() # Ensure widget is properly deleted
+            self._release_row(row)
 
     def clear_all_confirm(self):
         if self.rows:
@@ -923,20 +1208,58 @@ class StrategySection(QWidget):
                 self.clear_all()
 
     def clear_all(self):
-        for r in self.rows[:]: # Iterate over a copy to allow modification during loop
-            self.remove_row(r)
+        if not self.rows:
+            return
+        # 행마다 레이아웃을 다시 그리지 않도록 갱신을 멈춘 채 한 번에 제거
+        self.container.setUpdatesEnabled(False)
+        try:
+            for r in self.rows:
+                self._release_row(r)
+            self.rows.clear()
+        finally:
+            self.container.setUpdatesEnabled(True)
+            self.container.update()
 
     def get_configs(self):
         return [r.get_config() for r in self.rows]
 
     def set_configs(self, cfg_list):
-        self.clear_all()
-        for cfg in cfg_list:
-            self.add_row(cfg)
+        # 이미 같은 전략이 표시 중이면 (예: 전략 구성이 같은 종목 간 전환) 위젯을 허물고 다시 만들지 않음
+        if cfg_list == self.get_configs():
+            return
+        # 기존 행을 앞에서부터 재사용: 설정이 같은 행은 그대로 두고 다른 행만 값을 바꾼 뒤, 모자라면 추가/남으면 풀로 반환
+        self.container.setUpdatesEnabled(False)
+        try:
+            for row, cfg in zip(self.rows, cfg_list):
+                if row.get_config() != cfg:
+                    row.set_config(cfg)
+            for cfg in cfg_list[len(self.rows):]:
+                self.add_row(cfg)
+            for row in self.rows[len(cfg_list):]:
+                self._release_row(row)
+            del self.rows[len(cfg_list):]
+        finally:
+            self.container.setUpdatesEnabled(True)
+            self.container.update()
+
+def _log_format(color: str) -> QTextCharFormat:
+    fmt = QTextCharFormat()
+    fmt.setForeground(QColor(color))
+    return fmt
 
 class StatusPanel(QWidget):
+    LOG_MAX_BLOCKS = 5000  # 로그 창에 유지할 최대 줄 수 (초과 시 오래된 줄부터 삭제)
+    LOG_FLUSH_INTERVAL_MS = 200  # 모아 둔 로그를 화면에 반영하는 주기
+    LOG_FORMATS = {
+        "INFO": _log_format("#ffffff"),    # White
+        "SUCCESS": _log_format("#28a745"), # Green
+        "WARN": _log_format("#ffc107"),    # Yellow
+        "ERROR": _log_format("#dc3545"),   # Red
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._log_buffer: List[Tuple[str, str, str]] = []  # (timestamp, level, message)
         self._build_ui()
         self._setup_timer()
 
@@ -968,33 +1291,72 @@ class StatusPanel(QWidget):
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout(log_group)
         
-        self.text_log = QTextEdit()
+        # 로그 뷰어는 리치 텍스트 레이아웃이 필요 없으므로 QPlainTextEdit 사용
+        self.text_log = QPlainTextEdit()
         self.text_log.setReadOnly(True)
+        self.text_log.setMaximumBlockCount(self.LOG_MAX_BLOCKS)
+        # 로그 삽입 전용 커서를 한 번만 만들어 재사용 (textCursor()는 호출마다 복사본을 생성)
+        self._log_cursor = QTextCursor(self.text_log.document())
         log_layout.addWidget(self.text_log)
         
         layout.addWidget(log_group)
 
     def _setup_timer(self):
-        self.timer = QTimer()
+        # 현재 시간 표시는 패널이 보일 때만 갱신 (showEvent/hideEvent에서 시작/정지)
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
         self.timer.timeout.connect(self._update_time)
-        self.timer.start(1000)
+
+        # 로그는 즉시 그리지 않고 버퍼에 모았다가 주기적으로 한 번에 삽입
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        self._flush_timer.start(self.LOG_FLUSH_INTERVAL_MS)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_time()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.timer.stop()
 
     def _update_time(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
-        self.lbl_update_time.setText(current_time)
+        self.lbl_update_time.setText(time.strftime("%H:%M:%S"))
 
     def add_log(self, message, level="INFO"):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        color = {
-            "INFO": "#ffffff",   # White
-            "SUCCESS": "#28a745", # Green
-            "WARN": "#ffc107",   # Yellow
-            "ERROR": "#dc3545"    # Red
-        }.get(level, "#ffffff")
-        
-        log_entry = f'<p style="color:{color}; margin: 2px;">[{timestamp}] [{level}] {message}</p>'
-        self.text_log.insertHtml(log_entry)
-        self.text_log.verticalScrollBar().setValue(self.text_log.verticalScrollBar().maximum())
+        self._log_buffer.append((timestamp, level, message))
+
+    def _flush_logs(self):
+        """버퍼에 쌓인 로그를 한 번의 편집 블록으로 삽입합니다 (같은 레벨이 연속되면 한 문자열로 합침)."""
+        if not self._log_buffer:
+            return
+        entries, self._log_buffer = self._log_buffer, []
+
+        # 사용자가 위로 스크롤해 이전 로그를 보고 있을 때는 위치를 유지
+        bar = self.text_log.verticalScrollBar()
+        at_bottom = bar.value() == bar.maximum()
+
+        formats = self.LOG_FORMATS
+        cursor = self._log_cursor
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        try:
+            run_level, run_lines = None, []
+            for timestamp, level, message in entries:
+                if level != run_level and run_lines:
+                    cursor.insertText("".join(run_lines), formats.get(run_level, formats["INFO"]))
+                    run_lines = []
+                run_level = level
+                run_lines.append(f"[{timestamp}] [{level}] {message}\n")
+            if run_lines:
+                cursor.insertText("".join(run_lines), formats.get(run_level, formats["INFO"]))
+        finally:
+            cursor.endEditBlock()
+
+        if at_bottom:
+            bar.setValue(bar.maximum())
 
 class AddSymbolDialog(QDialog):
     def __init__(self, creon_mgr, parent=None):
@@ -1009,42 +1371,36 @@ class AddSymbolDialog(QDialog):
         self.input.setPlaceholderText("종목코드 또는 종목명을 입력하세요")
         vbox.addWidget(self.input)
 
-        # Get all stock codes from Creon
-        all_codes = []
-        if self.creon.is_initialized:
-            all_codes.extend(self.creon.cp_code_mgr.GetStockListByMarket(1)) # KOSPI
-            all_codes.extend(self.creon.cp_code_mgr.GetStockListByMarket(2)) # KOSDAQ
-        
-        self.stock_list = [(c, self.creon.get_stock_name(c)) for c in all_codes]
-        self.stock_list = [(c, n) for c, n in self.stock_list if n] # Filter out empty names
-
-        # Create completer list
-        completer_list = [f"{name} ({code})" for code, name in self.stock_list]
-        self.completer = QCompleter(completer_list, self)
+        # 전체 종목 목록/자동완성 목록은 CreonManager에 캐시된 것을 재사용
+        self.stock_list = self.creon.get_all_stocks_cached()
+        self._by_code = {c: n for c, n in self.stock_list}
+        self._by_name = {n: c for c, n in self.stock_list}
+        # 대소문자 무시 정렬된 모델임을 알려 주면 QCompleter가 선형 탐색 대신 이진 탐색으로 후보를 찾음
+        self._completer_model = QStringListModel(self.creon.completer_list, self)
+        self.completer = QCompleter(self._completer_model, self)
         self.completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+        self.completer.setFilterMode(Qt.MatchStartsWith)
+        self.completer.setMaxVisibleItems(20)
         self.input.setCompleter(self.completer)
 
         def select_code():
             text = self.input.text()
             # If using autocomplete, the format is "Stock Name (Code)"
             if "(" in text and text.endswith(")"):
-                try:
-                    code_in_text = text[text.rfind("(")+1:-1]
-                    for code, name in self.stock_list:
-                        if code == code_in_text:
-                            self.selected_code = code
-                            self.accept()
-                            return
-                except:
-                    pass # Ignore malformed input
-            
-            # If directly typed
-            for code, name in self.stock_list:
-                if text == code or text == name:
-                    self.selected_code = code
+                code_in_text = text[text.rfind("(")+1:-1]
+                if code_in_text in self._by_code:
+                    self.selected_code = code_in_text
                     self.accept()
                     return
             
+            # If directly typed
+            code = text if text in self._by_code else self._by_name.get(text)
+            if code:
+                self.selected_code = code
+                self.accept()
+                return
+            
             QMessageBox.warning(self, "오류", "유효한 종목 코드 또는 종목명을 입력해주세요.")
 
         self.input.returnPressed.connect(select_code)
@@ -1064,6 +1420,15 @@ class TradingWorker(QThread):
     log_signal = pyqtSignal(str, str)
     trade_signal = pyqtSignal(str)
 
+    TICK_QUEUE_SIZE = 1         # 실시간 틱 버퍼 크기 (최신 틱만 사용하므로 1개만 보관)
+    TICK_WAIT_TIMEOUT = 1.0     # 새 틱을 기다리는 최대 시간(초) – 틱이 들어오면 즉시 깨어남
+    OFF_HOURS_WAIT_MAX = 60.0   # 장 시간 외 한 번에 쉬는 최대 시간(초) – 시계 변경 등에 대비한 상한
+    ORDER_ACK_TIMEOUT = 2.0     # 주문 후 체결 통보를 기다리는 최대 시간(초)
+
+    # 매수 전략/조건 구분값 (SoA 배열용)
+    BUY_STRAT_IDS = {"N일고점돌파": 0, "특정가격돌파": 1}
+    BUY_COND_IDS = {"조건없음": 0, "거래량": 1, "거래대금": 2}
+
     def __init__(self, creon, code, strategies):
         super().__init__()
         self.creon = creon
@@ -1076,7 +1441,10 @@ class TradingWorker(QThread):
 
         # 내부 상태
         self._stop_event = threading.Event()
-        self.data_queue = queue.Queue()
+        self._refresh_event = threading.Event()  # N일 고점/저점 갱신 요청 (TradingManager 타이머가 set)
+        self._order_ack = threading.Event()      # 주문 체결 통보 (CreonManager 체결 핸들러가 set)
+        self.data_queue = deque(maxlen=self.TICK_QUEUE_SIZE)  # 실시간 틱 (CpEventClass가 append)
+        self.tick_event = threading.Event()  # 새 틱 도착/중지 요청 알림 (CpEventClass가 append 후 set)
         self.trailing_stop_active = False
         self.trailing_peak_price = 0
         self.trailing_base_price_met = False
@@ -1092,90 +1460,139 @@ class TradingWorker(QThread):
         self.nday_low_targets = {}
         self.last_low_refresh_date = None
 
+        # 전략 설정을 판정 함수로 미리 변환 (틱마다 전략명 문자열 비교/cfg 조회 방지)
+        self._compiled_buy = [(cfg, self._compile_buy(cfg)) for cfg in self.buy_strategies]
+        # 매도 전략은 처리 방식별로 미리 나눠 둠 (틱마다 전략명으로 분기하지 않도록)
+        self._trailing_cfgs = [c for c in self.sell_strategies if c.get("strategy") == "트레일링스탑"]
+        self._nday_low_cfgs = [(c, self._compile_sell(c)) for c in self.sell_strategies
+                               if c.get("strategy") == "N일저점이탈"]
+        self._generic_sell_cfgs = [(c, self._compile_sell(c)) for c in self.sell_strategies
+                                   if c.get("strategy") not in ("트레일링스탑", "N일저점이탈")]
+
+        # 트레일링 스탑 설정별 배수와, 기준 고점이 바뀔 때만 다시 계산하는 발동/매도 가격
+        # { id(cfg): [상승 배수, 하락 배수, 계산 기준 고점, 활성화 가격, 매도 가격] }
+        # (cfg는 저장되는 전략 설정이므로 계산값을 cfg에 넣지 않고 워커가 따로 보관)
+        self._trail_state = {
+            id(cfg): [1 + cfg.get("raise_pct", 0) / 100, 1 - cfg.get("trail_pct", 0) / 100, None, 0, 0]
+            for cfg in self._trailing_cfgs
+        }
+
+        # 매수 전략을 전략별 병렬 배열(SoA)로 구성해 틱마다 한 번의 벡터 비교로 후보만 추림
+        buy = self.buy_strategies
+        kind = np.array([self.BUY_STRAT_IDS.get(c.get("strategy"), -1) for c in buy], dtype=np.int8)
+        cond = np.array([self.BUY_COND_IDS.get(c.get("cond_type"), -1) for c in buy], dtype=np.int8)
+        self._buy_is_high = kind == 0
+        self._buy_is_price = kind == 1
+        self._buy_params = np.array([c.get("param", 0) for c in buy], dtype=np.float64)
+        self._buy_cond_none = cond == 0
+        self._buy_cond_volume = cond == 1
+        self._buy_cond_value = cond == 2
+        self._buy_cond_values = np.array([c.get("cond_value", 0) for c in buy], dtype=np.float64)
+        self._buy_highs = np.full(len(buy), np.inf)  # N일고점돌파 기준 고점 (미조회 시 inf → 불통과)
+
     def refresh_nday_high_targets(self):
         today = datetime.now().strftime("%Y%m%d")
         if self.last_high_refresh_date == today:
             return
+        ns = [cfg.get("param", 0) for cfg in self.buy_strategies if cfg.get("strategy") == "N일고점돌파"]
+        highs = self.creon.get_cached_high_targets(self.code, ns, today)
+        # 판정 함수가 이 dict를 참조하므로 교체하지 않고 내용만 갱신
         self.nday_high_targets.clear()
-        for cfg in self.buy_strategies:
-            if cfg.get("strategy") == "N일고점돌파":
-                n = cfg.get("param", 0)
-                high = self.creon.get_high_price_for_days(self.code, n)
-                if high > 0:
-                    self.nday_high_targets[n] = high
-                    self.log_signal.emit(f"[{self.code}] {n}일 고점(갱신): {high:,}원", "INFO")
-                else:
-                    self.log_signal.emit(f"[{self.code}] {n}일 고점 조회 실패; 전략 건너뜀", "WARN")
+        self.nday_high_targets.update(highs)
+        for i in np.flatnonzero(self._buy_is_high):
+            self._buy_highs[i] = highs.get(self.buy_strategies[i].get("param", 0)) or np.inf
+        for n in ns:
+            high = highs.get(n)
+            if high:
+                self.log_signal.emit(f"[{self.code}] {n}일 고점(갱신): {high:,}원", "INFO")
+            else:
+                self.log_signal.emit(f"[{self.code}] {n}일 고점 조회 실패; 전략 건너뜀", "WARN")
         self.last_high_refresh_date = today
 
     def refresh_nday_low_targets(self):
         today = datetime.now().strftime("%Y%m%d")
         if self.last_low_refresh_date == today:
             return
+        ns = [cfg.get("param", 0) for cfg in self.sell_strategies if cfg.get("strategy") == "N일저점이탈"]
+        lows = self.creon.get_cached_low_targets(self.code, ns, today)
         self.nday_low_targets.clear()
-        for cfg in self.sell_strategies:
-            if cfg.get("strategy") == "N일저점이탈":
-                n = cfg.get("param", 0)
-                low = self.creon.get_low_price_for_days(self.code, n)
-                if low > 0:
-                    self.nday_low_targets[n] = low
-                    self.log_signal.emit(f"[{self.code}] {n}일 저점(갱신): {low:,}원", "INFO")
-                else:
-                    self.log_signal.emit(f"[{self.code}] {n}일 저점 조회 실패; 전략 건너뜀", "WARN")
+        self.nday_low_targets.update(lows)
+        for n in ns:
+            low = lows.get(n)
+            if low:
+                self.log_signal.emit(f"[{self.code}] {n}일 저점(갱신): {low:,}원", "INFO")
+            else:
+                self.log_signal.emit(f"[{self.code}] {n}일 저점 조회 실패; 전략 건너뜀", "WARN")
         self.last_low_refresh_date = today
 
+    def request_target_refresh(self):
+        """다음 루프에서 N일 고점/저점을 갱신하도록 요청합니다 (GUI 스레드에서 호출)."""
+        self._refresh_event.set()
+        self.tick_event.set()  # 틱 대기 중이면 깨워서 바로 갱신
+
     def stop(self):
         self._stop_event.set()
+        self.tick_event.set()  # 틱 대기 중이면 바로 깨움
         self.log_signal.emit(f"[{self.code}] 자동매매 스레드 중지 요청", "INFO")
 
     def run(self):
-        pythoncom.CoInitialize()
+        self.creon.enter_thread()
         self.log_signal.emit(f"[{self.code}] 자동매매 스레드 시작", "INFO")
-
-        # 초기 잔고/평단 및 전일 종가 조회
-        self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
-        info = self.creon.get_stock_info(self.code)
-        if info:
-            self.prev_close_price = info.get("close_price", 0)
-
-        # N일 고점/저점 최초 갱신
-        self.refresh_nday_high_targets()
-        self.refresh_nday_low_targets()
-        
         try:
+            self.creon.register_order_event(self.code, self._order_ack)
+
+            # 초기 잔고/평단 및 전일 종가 조회
+            self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
+            info = self.creon.get_stock_info(self.code)
+            if info:
+                self.prev_close_price = info.get("close_price", 0)
+
+            # N일 고점/저점 최초 갱신
+            self.refresh_nday_high_targets()
+            self.refresh_nday_low_targets()
+
+            # 거래대금 보정 배수 테이블이 준비될 때까지 대기 (그 전에 들어온 틱은 보정되지 않았으므로 버림)
+            if not self.creon.market_ready.is_set():
+                while not self.creon.market_ready.wait(self.TICK_WAIT_TIMEOUT):
+                    if self._stop_event.is_set():
+                        return
+                self.data_queue.clear()
+
             while not self._stop_event.is_set():
                 # 장 시작 전이나 장 마감 후에는 불필요한 루프 방지
-                current_time = datetime.now().time()
-                if not (datetime.strptime("09:00", "%H:%M").time() <= current_time <= datetime.strptime("15:30", "%H:%M").time()):
-                    time.sleep(1)
+                now = datetime.now()
+                if not (MARKET_OPEN <= now.time() <= MARKET_CLOSE):
+                    # 장 시작까지 (최대 OFF_HOURS_WAIT_MAX초) 쉬고, 중지 요청 시 즉시 깨어남
+                    self._stop_event.wait(min(_seconds_until_market_open(now), self.OFF_HOURS_WAIT_MAX))
                     continue
 
-                # 매 5분마다 N일 고점/저점 갱신
-                if datetime.now().minute % 5 == 0 and datetime.now().second < 5:
+                # TradingManager가 5분마다 요청하면 N일 고점/저점 갱신
+                if self._refresh_event.is_set():
+                    self._refresh_event.clear()
                     self.refresh_nday_high_targets()
                     self.refresh_nday_low_targets()
 
-                try:
-                    # 큐에서 가장 최신 데이터 하나만 사용
-                    data = self.data_queue.get(timeout=1.0)
-                    while not self.data_queue.empty():
-                        data = self.data_queue.get_nowait()
-                except queue.Empty:
+                # 큐에서 가장 최신 데이터 하나만 사용
+                # 큐를 확인하기 전에 이벤트를 지워야 확인 직후 들어온 틱의 알림을 놓치지 않음
+                self.tick_event.clear()
+                if not self.data_queue:
+                    self.tick_event.wait(self.TICK_WAIT_TIMEOUT)
                     continue # 데이터 없으면 다음 루프로
+                data = self.data_queue.popleft()
 
                 # --- 수정된 매수 로직 ---
                 if self.buy_enabled and self.quantity_held <= 0:
-                    for cfg in self.buy_strategies:
-                        if self._check_buy_condition(cfg, data):
-                            qty = self._calculate_buy_qty(cfg, data.get("current_price", 0))
-                            if qty > 0 and self.creon.place_order(self.code, qty, 0, is_buy=True):
+                    for i in self._buy_candidates(data):
+                        cfg, check = self._compiled_buy[i]
+                        if check(data):
+                            qty = self._calculate_buy_qty(cfg, data.current_price)
+                            if qty > 0 and self._place_order(qty, is_buy=True):
                                 self.log_signal.emit(
                                     f"[{self.code}] 매수 체결: {cfg['strategy']} – {qty}주", "SUCCESS"
                                 )
                                 self.trade_signal.emit(self.code)
-                                time.sleep(0.5)
-                                # 체결 후 즉시 잔고/평단가 업데이트
-                                self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
+                                # 체결 통보 후 즉시 잔고/평단가 업데이트
+                                self._await_fill()
                                 # 트레일링 스탑 관련 상태 초기화
                                 self.trailing_stop_active = False
                                 self.trailing_peak_price = 0
@@ -1184,113 +1601,195 @@ class TradingWorker(QThread):
 
                 # --- 수정된 매도 로직 ---
                 elif self.sell_enabled and self.quantity_held > 0:
-                    data['close_price'] = self.prev_close_price
-                    for cfg in self.sell_strategies:
-                        # 트레일링 스탑은 자체적으로 매도 주문까지 처리하므로 별도 핸들링
-                        if cfg.get("strategy") == "트레일링스탑":
-                            self._execute_trailing_stop(cfg, data, self.quantity_held, self.avg_buy_price)
-                            if self.quantity_held <= 0: break # 전량 매도되었다면 루프 탈출
-                            continue # 트레일링 스탑 조건이 아니면 다음 매도 전략으로
-
-                        # 기타 매도 전략 확인
-                        should_sell = False
-                        if cfg.get("strategy") == "N일저점이탈":
-                            low_target = self.nday_low_targets.get(cfg.get("param", 0))
-                            current_price = data.get("current_price", 0)
-                            if low_target and current_price > 0 and current_price < low_target:
-                                self.log_signal.emit(f"[{self.code}] N일저점이탈: 현재가 {current_price:,} < 목표 {low_target:,}", "INFO")
-                                should_sell = True
-                        elif self._check_sell_condition(cfg, data, self.quantity_held, self.avg_buy_price):
-                            should_sell = True
-
-                        if should_sell:
-                            sell_qty = self._calculate_sell_qty(cfg, self.quantity_held, data.get("current_price", 0))
-                            if sell_qty > 0 and self.creon.place_order(self.code, sell_qty, 0, is_buy=False):
-                                self.log_signal.emit(f"[{self.code}] 매도 체결: {cfg['strategy']} – {sell_qty}주", "SUCCESS")
-                                self.trade_signal.emit(self.code)
-                                time.sleep(0.5)
-                                self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
-                                if self.quantity_held <= 0: self.stop() # 전량 매도 시 스레드 종료
-                                break # 매도 성공 시 루프 탈출
+                    # 트레일링 스탑은 자체적으로 매도 주문까지 처리하므로 별도 핸들링
+                    for cfg in self._trailing_cfgs:
+                        self._execute_trailing_stop(cfg, data, self.quantity_held, self.avg_buy_price)
+                        if self.quantity_held <= 0: break # 전량 매도되었다면 루프 탈출
+
+                    # N일저점이탈 → 기타 매도 전략 순으로 확인 (매도 성공 시 나머지는 확인하지 않음)
+                    if self.quantity_held > 0:
+                        for cfg, check in self._nday_low_cfgs:
+                            if check(data, self.avg_buy_price) and self._sell_on_signal(cfg, data):
+                                break
+                        else:
+                            for cfg, check in self._generic_sell_cfgs:
+                                if check(data, self.avg_buy_price) and self._sell_on_signal(cfg, data):
+                                    break
                 
         except Exception as e:
             self.log_signal.emit(f"[{self.code}] 처리 오류: {e}", "ERROR")
             logging.exception(f"[{self.code}] 예외 발생")
         finally:
-            pythoncom.CoUninitialize()
+            self.creon.unregister_order_event(self.code, self._order_ack)
+            self.creon.leave_thread()
             self.log_signal.emit(f"[{self.code}] 스레드 종료", "INFO")
 
-    def _check_buy_condition(self, cfg, info):
-        strat = cfg.get("strategy")
-        cur = info.get("current_price", 0)
-        logging.info(f"[{self.code}] 전략: {strat}, 현재가: {cur}, 전략 파라미터: {cfg.get('param')}")
-        logging.info(f"[{self.code}] 매수 조건 체크 중 – 전략: {cfg}, 데이터: {info}")
+    def _sell_on_signal(self, cfg, info) -> bool:
+        """매도 조건이 충족된 전략의 매도 주문을 냅니다. 주문이 체결되면 True."""
+        sell_qty = self._calculate_sell_qty(cfg, self.quantity_held, info.current_price)
+        if sell_qty > 0 and self._place_order(sell_qty, is_buy=False):
+            self.log_signal.emit(f"[{self.code}] 매도 체결: {cfg['strategy']} – {sell_qty}주", "SUCCESS")
+            self.trade_signal.emit(self.code)
+            self._await_fill()
+            if self.quantity_held <= 0: self.stop() # 전량 매도 시 스레드 종료
+            return True
+        return False
+
+    def _place_order(self, qty, is_buy):
+        # 이전 주문의 체결 통보가 남아 있지 않도록 주문 전에 초기화
+        self._order_ack.clear()
+        return self.creon.place_order(self.code, qty, 0, is_buy=is_buy)
 
+    def _await_fill(self):
+        """주문 체결 통보를 기다린 뒤 (없으면 ORDER_ACK_TIMEOUT 후) 잔고/평단가를 갱신합니다."""
+        if not self._order_ack.wait(self.ORDER_ACK_TIMEOUT):
+            self.log_signal.emit(f"[{self.code}] 체결 통보 대기 시간 초과 – 잔고 조회로 확인합니다.", "WARN")
+        self._order_ack.clear()
+        self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
+
+    def _buy_candidates(self, info):
+        """모든 매수 전략을 벡터 연산으로 평가해 조건을 만족할 수 있는 전략 인덱스를 반환합니다."""
+        if not self._compiled_buy:
+            return ()
+        cur = info.current_price
         if cur is None or cur <= 0:
             logging.warning(f"[{self.code}] 현재가 없음: cur={cur} → 매수 건너뜀")
-            return False
+            return ()
+
+        vals = self._buy_cond_values
+        cond_ok = (self._buy_cond_none
+                   | (self._buy_cond_volume & (info.volume >= vals))
+                   | (self._buy_cond_value & (info.trade_value >= vals)))
+        hits = (self._buy_is_high & (cur > self._buy_highs)) | (self._buy_is_price & (cur >= self._buy_params) & cond_ok)
+        candidates = np.flatnonzero(hits)
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("[%s] 매수 조건 체크 – 현재가: %s, 전략 %d개 중 후보 %d개", self.code, cur, len(hits), len(candidates))
+        return candidates
+
+    def _compile_buy(self, cfg):
+        """매수 전략 설정을 틱마다 호출할 판정 함수 check(info) -> bool 로 변환합니다."""
+        code = self.code
+        emit = self.log_signal.emit
+        strat = cfg.get("strategy")
+        param = cfg.get("param", 0)
+
+        def precheck(cur, info):
+            if _log.isEnabledFor(logging.INFO):
+                _log.info("[%s] 전략: %s, 현재가: %s, 전략 파라미터: %s", code, strat, cur, cfg.get('param'))
+                _log.info("[%s] 매수 조건 체크 중 – 전략: %s, 데이터: %s", code, cfg, info)
+            if cur is None or cur <= 0:
+                logging.warning(f"[{code}] 현재가 없음: cur={cur} → 매수 건너뜀")
+                return False
+            return True
 
         if strat == "N일고점돌파":
-            high = self.nday_high_targets.get(cfg.get("param", 0))
-            logging.info(f"[{self.code}] 현재가 {cur}, 고점 {high} / 조건 확인 중 (전략: {strat})")
-            if high and cur > high:
-                logging.info(f"[{self.code}] 매수 조건 통과! (N일고점돌파) → 현재가: {cur}, 고점: {high}")
-                self.log_signal.emit(
-                    f"[{self.code}] N일고점돌파: 현재가 {cur:,} > 고점 {high:,}",
-                    "INFO"
-                )
-                return True
+            targets = self.nday_high_targets  # 갱신 시 같은 dict를 비우고 채우므로 참조만 보관
 
-        elif strat == "특정가격돌파":
-            tgt = cfg.get("param", 0)
-            logging.info(f"[{self.code}] 전략 조건 확인 중 – 현재가: {cur}, 목표: {tgt}")
-            if cur < tgt:
+            def check(info):
+                cur = info.current_price
+                if not precheck(cur, info):
+                    return False
+                high = targets.get(param)
+                if _log.isEnabledFor(logging.INFO):
+                    _log.info("[%s] 현재가 %s, 고점 %s / 조건 확인 중 (전략: %s)", code, cur, high, strat)
+                if high and cur > high:
+                    _log.info("[%s] 매수 조건 통과! (N일고점돌파) → 현재가: %s, 고점: %s", code, cur, high)
+                    emit(f"[{code}] N일고점돌파: 현재가 {_fmt_int(cur)} > 고점 {_fmt_int(high)}", "INFO")
+                    return True
                 return False
-            if cfg.get("cond_type") == "조건없음":
-                return True
-            if cfg.get("cond_type") == "거래량" and info.get("volume", 0) >= cfg.get("cond_value", 0):
-                return True
-            if cfg.get("cond_type") == "거래대금" and info.get("trade_value", 0) >= cfg.get("cond_value", 0):
-                return True
+            return check
+
+        if strat == "특정가격돌파":
+            cond_type = cfg.get("cond_type")
+            cond_value = cfg.get("cond_value", 0)
+            if cond_type == "조건없음":
+                cond = lambda info: True
+            elif cond_type == "거래량":
+                cond = lambda info: info.volume >= cond_value
+            elif cond_type == "거래대금":
+                cond = lambda info: info.trade_value >= cond_value
+            else:
+                cond = lambda info: False
 
-        return False
+            def check(info):
+                cur = info.current_price
+                if not precheck(cur, info):
+                    return False
+                if _log.isEnabledFor(logging.INFO):
+                    _log.info("[%s] 전략 조건 확인 중 – 현재가: %s, 목표: %s", code, cur, param)
+                if cur < param:
+                    return False
+                return cond(info)
+            return check
+
+        def check(info):
+            precheck(info.current_price, info)
+            return False
+        return check
 
     def _calculate_buy_qty(self, cfg, cur):
         amt = cfg.get("amount", 0)
         return amt // cur if cur > 0 else 0
 
-    def _check_sell_condition(self, cfg, info, qty, avg):
-        # N일저점이탈은 run()에서 바로 처리하므로 여기선 나머지 전략만
-        cur = info.get("current_price", 0)
-        if avg <= 0:
-            return False
+    def _compile_sell(self, cfg):
+        """매도 전략 설정을 판정 함수 check(info, avg) -> bool 로 변환합니다 (트레일링 스탑은 None)."""
+        code = self.code
+        emit = self.log_signal.emit
         strat = cfg.get("strategy")
         param = cfg.get("param", 0)
+
+        if strat == "트레일링스탑":
+            return None
+
+        if strat == "N일저점이탈":
+            targets = self.nday_low_targets
+
+            def check(info, avg):
+                low_target = targets.get(param)
+                cur = info.current_price
+                if low_target and cur > 0 and cur < low_target:
+                    emit(f"[{code}] N일저점이탈: 현재가 {_fmt_int(cur)} < 목표 {_fmt_int(low_target)}", "INFO")
+                    return True
+                return False
+            return check
+
         if strat == "수익률매도":
-            if (cur - avg) / avg * 100 >= param:
-                self.log_signal.emit(
-                    f"[{self.code}] 수익률매도: {((cur-avg)/avg*100):.2f}% >= {param}%",
-                    "INFO"
-                )
-                return True
-        elif strat == "손절매":
-            if (avg - cur) / avg * 100 >= param:
-                self.log_signal.emit(
-                    f"[{self.code}] 손절매: {((avg-cur)/avg*100):.2f}% >= {param}%",
-                    "WARN"
-                )
-                return True
-        elif strat == "특정가격이탈":
-            if cur <= param:
-                self.log_signal.emit(
-                    f"[{self.code}] 특정가격이탈: {cur:,} <= {param:,}",
-                    "INFO"
-                )
-                return True
-        return False
+            def check(info, avg):
+                if avg <= 0:
+                    return False
+                cur = info.current_price
+                if (cur - avg) / avg * 100 >= param:
+                    emit(f"[{code}] 수익률매도: {((cur-avg)/avg*100):.2f}% >= {param}%", "INFO")
+                    return True
+                return False
+            return check
+
+        if strat == "손절매":
+            def check(info, avg):
+                if avg <= 0:
+                    return False
+                cur = info.current_price
+                if (avg - cur) / avg * 100 >= param:
+                    emit(f"[{code}] 손절매: {((avg-cur)/avg*100):.2f}% >= {param}%", "WARN")
+                    return True
+                return False
+            return check
+
+        if strat == "특정가격이탈":
+            def check(info, avg):
+                if avg <= 0:
+                    return False
+                cur = info.current_price
+                if cur <= param:
+                    emit(f"[{code}] 특정가격이탈: {_fmt_int(cur)} <= {_fmt_int(param)}", "INFO")
+                    return True
+                return False
+            return check
+
+        return lambda info, avg: False
 
     def _execute_trailing_stop(self, cfg, info, qty, avg):
-        cur = info.get("current_price", 0)
+        cur = info.current_price
         if not self.trailing_base_price_met:
             base = cfg.get("trail_base", "현재가")
             if base == "매수평단가" and avg > 0:
@@ -1305,31 +1804,32 @@ class TradingWorker(QThread):
                 f"[{self.code}] 트레일링 초기 기준가: {peak:,}원", "INFO"
             )
             return
-        raise_pct = cfg.get("raise_pct", 0)
-        trail_pct = cfg.get("trail_pct", 0)
+        st = self._trail_state[id(cfg)]
+        peak = self.trailing_peak_price
+        if st[2] != peak:
+            st[2], st[3], st[4] = peak, peak * st[0], peak * st[1]
         if not self.trailing_stop_active:
-            if cur >= self.trailing_peak_price * (1 + raise_pct/100):
+            if cur >= st[3]:
                 self.trailing_stop_active = True
                 self.trailing_peak_price = cur
                 self.log_signal.emit(
-                    f"[{self.code}] 트레일링 활성화, 고점 갱신: {cur:,}원", "INFO"
+                    f"[{self.code}] 트레일링 활성화, 고점 갱신: {_fmt_int(cur)}원", "INFO"
                 )
             return
         if cur > self.trailing_peak_price:
             self.trailing_peak_price = cur
             self.log_signal.emit(
-                f"[{self.code}] 트레일링 고점 갱신: {cur:,}원", "INFO"
+                f"[{self.code}] 트레일링 고점 갱신: {_fmt_int(cur)}원", "INFO"
             )
-        elif cur <= self.trailing_peak_price * (1 - trail_pct/100):
+        elif cur <= st[4]:
             sell_qty = self._calculate_sell_qty(cfg, qty, cur)
             if sell_qty > 0:
-                if self.creon.place_order(self.code, sell_qty, 0, is_buy=False):
+                if self._place_order(sell_qty, is_buy=False):
                     self.log_signal.emit(
                         f"[{self.code}] 트레일링 매도: {sell_qty}주", "SUCCESS"
                     )
                     self.trade_signal.emit(self.code)
-                    time.sleep(0.5)
-                    self.quantity_held, self.avg_buy_price = self.creon.get_stock_balance_and_avg_price(self.code)
+                    self._await_fill()
                     if self.quantity_held == 0 and cfg.get("method") == "전량":
                         self.stop()
                 else:
@@ -1351,6 +1851,8 @@ class TradingWorker(QThread):
 # 교체할 클래스: TradingManager
 class TradingManager:
     """Manages multiple TradingWorker threads."""
+    TARGET_REFRESH_INTERVAL_MS = 5 * 60 * 1000  # N일 고점/저점 갱신 요청 주기
+
     def __init__(self, creon_mgr: CreonManager, status_panel: StatusPanel, refresh_callback=None):
         self.creon = creon_mgr
         self.status_panel = status_panel
@@ -1358,6 +1860,11 @@ class TradingManager:
         self.workers = {}  # {code: TradingWorker instance}
         self.is_auto_trading_active = False
 
+        # 워커마다 시계를 확인하지 않도록 GUI 스레드 타이머 하나가 갱신 요청을 전달
+        self._target_refresh_timer = QTimer()
+        self._target_refresh_timer.setInterval(self.TARGET_REFRESH_INTERVAL_MS)
+        self._target_refresh_timer.timeout.connect(self._request_target_refresh)
+
     def start_trading(self, strategy_data: dict, selected_codes: list):
         if self.is_auto_trading_active:
             self.status_panel.add_log("자동매매가 이미 실행 중입니다.", "WARN")
@@ -1381,13 +1888,15 @@ class TradingManager:
                 worker.trade_signal.connect(self._handle_trade_signal)
                 
                 # <<< [추가] 스레드를 시작하기 전 실시간 구독 요청
-                self.creon.subscribe_realtime(code, worker.data_queue)
+                self.creon.subscribe_realtime(code, worker.data_queue, worker.tick_event)
 
                 self.workers[code] = worker
                 worker.start()
             else:
                 self.status_panel.add_log(f"[{code}] 이미 실행 중인 스레드가 있습니다.", "WARN")
 
+        self._target_refresh_timer.start()
+
     def stop_trading(self):
         if not self.is_auto_trading_active:
             self.status_panel.add_log("자동매매가 실행 중이 아닙니다.", "WARN")
@@ -1396,6 +1905,7 @@ class TradingManager:
         self.is_auto_trading_active = False
         self.status_panel.lbl_auto_status.setText("🟡 대기중")
         self.status_panel.add_log("자동매매 중지를 요청합니다. 스레드 종료 대기 중...", "INFO")
+        self._target_refresh_timer.stop()
 
         for code, worker in self.workers.items():
             # <<< [추가] 스레드 종료 전 실시간 구독 해지
@@ -1406,15 +1916,298 @@ class TradingManager:
         self.workers.clear()
         self.status_panel.add_log("모든 자동매매 스레드가 중지되었습니다.", "INFO")
 
+    def _request_target_refresh(self):
+        for worker in self.workers.values():
+            worker.request_target_refresh()
+
     def _handle_trade_signal(self, code: str):
         # 매매 체결 후 잔고/수익률 갱신을 위해 호출되는 콜백
         if callable(self.refresh_callback):
             self.refresh_callback(code)
 
 
+class _QuoteFetchSignals(QObject):
+    # (종목코드 목록, 현재가 목록, 잔고 목록, 평단가 목록, 전체 갱신 여부)
+    finished = pyqtSignal(list, list, list, list, bool)
+
+class QuoteFetchTask(QRunnable):
+    """현재가와 계좌 잔고를 GUI 스레드 밖에서 조회해 signals.finished로 보내는 작업."""
+    def __init__(self, creon: CreonManager, codes: List[str], full: bool):
+        super().__init__()
+        self.creon = creon
+        self.codes = codes
+        self.full = full
+        self.signals = _QuoteFetchSignals()
+
+    def run(self):
+        infos = self.creon.get_stock_infos_bulk(self.codes)
+        balances = self.creon.get_balance_snapshot()
+        prices, qtys, avg_prices = [], [], []
+        for code in self.codes:
+            info = infos.get(code)
+            qty, avg_price = balances.get(_full_code(code), (0, 0))
+            prices.append(info["current_price"] if info else 0)
+            qtys.append(qty)
+            avg_prices.append(avg_price)
+        self.signals.finished.emit(self.codes, prices, qtys, avg_prices, self.full)
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """모델의 CheckStateRole 값을 셀 가운데에 체크 박스로 그리고, 클릭 시 model.setData()로 뒤집는 델리게이트."""
+    OFF_COLOR = QColor("#404040")
+    OFF_BORDER = QColor("#555555")
+
+    def __init__(self, size: int, on_color: str, on_border: str, border_width: int = 1, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.radius = 4 if size > 16 else 3
+        # paint()는 보이는 셀마다 호출되므로 펜/브러시/사각형을 미리 만들어 두고 재사용
+        self._pens = {True: QPen(QColor(on_border), border_width), False: QPen(self.OFF_BORDER, border_width)}
+        self._brushes = {True: QBrush(QColor(on_color)), False: QBrush(self.OFF_COLOR)}
+        self._rect = QRect(0, 0, size, size)
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        # 기본 지시자는 왼쪽에 그려지므로 끄고 paint()에서 직접 가운데에 그림
+        option.features &= ~QStyleOptionViewItem.HasCheckIndicator
+
+    def _indicator_rect(self, cell: QRect) -> QRect:
+        # GUI 스레드에서만 호출되므로 같은 사각형 객체를 옮겨 가며 사용
+        self._rect.moveCenter(cell.center())
+        return self._rect
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(self._pens[checked])
+        painter.setBrush(self._brushes[checked])
+        painter.drawRoundedRect(self._indicator_rect(option.rect), self.radius, self.radius)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if not (index.flags() & Qt.ItemIsUserCheckable):
+            return False
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            # 기존 컨테이너 위젯처럼 셀 어디를 눌러도 토글
+            if option.rect.contains(event.pos()):
+                state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+                return model.setData(index, state, Qt.CheckStateRole)
+        elif event.type() == QEvent.MouseButtonDblClick:
+            return True  # 더블클릭은 뷰의 편집/더블클릭 처리로 넘기지 않음 (토글은 각 릴리스에서 처리)
+        return False
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """삭제 열의 "➖" 버튼을 그리고, 클릭된 행 번호를 delete_requested로 알리는 델리게이트."""
+    delete_requested = pyqtSignal(int)  # 행 번호
+
+    BUTTON_SIZE = 28
+    BRUSH = QBrush(QColor("#ff5656"))
+    HOVER_BRUSH = QBrush(QColor("#ff3b3b"))
+    LABEL_PEN = QPen(QColor("#ffffff"))
+    LABEL = "➖"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rect = QRect(0, 0, self.BUTTON_SIZE, self.BUTTON_SIZE)
+        self._font: Optional[QFont] = None  # 표 글꼴 기준 16px 라벨 글꼴 (첫 paint에서 한 번 생성)
+
+    def _button_rect(self, cell: QRect) -> QRect:
+        self._rect.moveCenter(cell.center())
+        return self._rect
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if self._font is None:
+            self._font = QFont(option.font)
+            self._font.setPixelSize(16)
+        rect = self._button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.HOVER_BRUSH if option.state & QStyle.State_MouseOver else self.BRUSH)
+        painter.drawRoundedRect(rect, 4, 4)
+        painter.setFont(self._font)
+        painter.setPen(self.LABEL_PEN)
+        painter.drawText(rect, Qt.AlignCenter, self.LABEL)
+        painter.restore()
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self._button_rect(option.rect).contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "종목 삭제", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if self._button_rect(option.rect).contains(event.pos()):
+                self.delete_requested.emit(index.row())
+                return True
+        return False
+
+class SymbolTableModel(QAbstractTableModel):
+    """종목 목록 테이블 모델 (열별 리스트에 값을 보관)."""
+    check_toggled = pyqtSignal(str, str, bool)  # (종목코드, strategy_data 키, 체크 여부)
+
+    HEADERS = ["ON", "코드", "종목명", "현재가", "잔고", "수익률", "매수", "매도", "삭제"]
+    COL_ON, COL_CODE, COL_NAME, COL_PRICE, COL_QTY, COL_PNL, COL_BUY, COL_SELL = 0, 1, 2, 3, 4, 5, 6, 7
+    CHECK_KEYS = {COL_ON: "on", COL_BUY: "buy_flag", COL_SELL: "sell_flag"}  # 체크 열 -> strategy_data 키
+    ALIGN_CENTER = int(Qt.AlignCenter)
+    ALIGN_NUMBER = int(Qt.AlignRight | Qt.AlignVCenter)
+    PNL_COLORS = {
+        1: QColor("#dc3545"),   # Red for profit
+        -1: QColor("#0d7377"),  # Blue for loss
+        0: QColor("#ffffff"),   # White for neutral
+    }
+    STRIPE_BRUSH = QBrush(QColor("#353535"))  # 홀수 행 배경 (setAlternatingRowColors 대체)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.codes: List[str] = []
+        self.names: List[str] = []
+        self.prices: List[int] = []
+        self.qtys: List[int] = []
+        self.pnls: List[Optional[float]] = []  # None: 아직 계산 전 (0.00% 표시)
+        self.checks: Dict[str, List[bool]] = {key: [] for key in self.CHECK_KEYS.values()}
+
+    def _columns(self):
+        return (self.codes, self.names, self.prices, self.qtys, self.pnls, *self.checks.values())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.codes)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() in self.CHECK_KEYS:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        key = self.CHECK_KEYS.get(index.column()) if index.isValid() else None
+        if role != Qt.CheckStateRole or key is None:
+            return False
+        row, checked = index.row(), value == Qt.Checked
+        self.checks[key][row] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_toggled.emit(self.codes[row], key, checked)
+        return True
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == self.COL_CODE:
+                return self.codes[row]
+            if col == self.COL_NAME:
+                return self.names[row]
+            if col == self.COL_PRICE:
+                return _fmt_money(self.prices[row])
+            if col == self.COL_QTY:
+                return _fmt_money(self.qtys[row])
+            if col == self.COL_PNL:
+                pnl = self.pnls[row]
+                return "0.00%" if pnl is None else _fmt_pnl(round(pnl, 2))
+        elif role == Qt.TextAlignmentRole:
+            if col == self.COL_CODE:
+                return self.ALIGN_CENTER
+            if self.COL_PRICE <= col <= self.COL_PNL:
+                return self.ALIGN_NUMBER
+        elif role == Qt.ForegroundRole and col == self.COL_PNL:
+            pnl = self.pnls[row]
+            if pnl is not None:
+                return self.PNL_COLORS[(pnl > 0) - (pnl < 0)]
+        elif role == Qt.BackgroundRole:
+            if row & 1:
+                return self.STRIPE_BRUSH
+        elif role == Qt.CheckStateRole and col in self.CHECK_KEYS:
+            return Qt.Checked if self.checks[self.CHECK_KEYS[col]][row] else Qt.Unchecked
+        return None
+
+    def add_row(self, code: str, name: str, price: int = 0, qty: int = 0, pnl: Optional[float] = None,
+                on: bool = True, buy_flag: bool = True, sell_flag: bool = True) -> int:
+        row = len(self.codes)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.codes.append(code)
+        self.names.append(name)
+        self.prices.append(price)
+        self.qtys.append(qty)
+        self.pnls.append(pnl)
+        self.checks["on"].append(on)
+        self.checks["buy_flag"].append(buy_flag)
+        self.checks["sell_flag"].append(sell_flag)
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for col in self._columns():
+            del col[row]
+        self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        for col in self._columns():
+            col.clear()
+        self.endResetModel()
+
+    def load_bulk(self, rows: List[Tuple[str, str, bool, bool, bool]]):
+        """(종목코드, 종목명, ON, 자동매수, 자동매도) 목록으로 전체 행을 한 번에 교체합니다."""
+        n = len(rows)
+        self.beginResetModel()
+        self.codes[:] = [r[0] for r in rows]
+        self.names[:] = [r[1] for r in rows]
+        self.checks["on"][:] = [r[2] for r in rows]
+        self.checks["buy_flag"][:] = [r[3] for r in rows]
+        self.checks["sell_flag"][:] = [r[4] for r in rows]
+        self.prices[:] = [0] * n
+        self.qtys[:] = [0] * n
+        self.pnls[:] = [None] * n
+        self.endResetModel()
+
+    def set_quotes(self, prices: List[int], qtys: List[int], avg_prices: List[int]):
+        """모든 행의 현재가/잔고/수익률을 한 번에 교체합니다."""
+        n = len(self.codes)
+        if not n:
+            return
+        cur = np.asarray(prices, dtype=np.float64)
+        avg = np.asarray(avg_prices, dtype=np.float64)
+        valid = (np.asarray(qtys) > 0) & (avg > 0) & (cur > 0)
+        pnl = np.divide(cur - avg, avg, out=np.zeros(n), where=valid) * 100.0
+        pnls = np.where(valid, pnl, None).tolist()
+        if prices == self.prices and qtys == self.qtys and pnls == self.pnls:
+            return  # 직전 조회와 동일하면 다시 그릴 필요 없음
+        self.prices[:], self.qtys[:], self.pnls[:] = prices, qtys, pnls
+        self.dataChanged.emit(self.index(0, self.COL_PRICE), self.index(n - 1, self.COL_PNL))
+
+    def set_quote(self, row: int, price: int, qty: int, pnl: Optional[float]):
+        """한 행의 현재가/잔고/수익률을 갱신하고 바뀐 열만 다시 그립니다."""
+        changed = []
+        if self.prices[row] != price:
+            self.prices[row] = price
+            changed.append(self.COL_PRICE)
+        if self.qtys[row] != qty:
+            self.qtys[row] = qty
+            changed.append(self.COL_QTY)
+        if self.pnls[row] != pnl:
+            self.pnls[row] = pnl
+            changed.append(self.COL_PNL)
+        if changed:
+            self.dataChanged.emit(self.index(row, changed[0]), self.index(row, changed[-1]))
+
 # 교체할 클래스: MainWindow
 class MainWindow(QMainWindow):
     CONFIG_FILE = "user_config.json"
+    REALTIME_UI_INTERVAL_MS = 100  # 실시간 시세 화면 반영 주기
+    DIRTY_REFRESH_DELAY_MS = 100   # 체결 등으로 갱신 요청된 종목을 모아서 조회하는 지연 시간
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Creon Auto Trader Pro v9.0 (Realtime)") # <<< 버전명 변경
@@ -1424,99 +2217,84 @@ class MainWindow(QMainWindow):
         
         self.strategy_data = {}
         self.current_code = None
+        self._row_by_code: Dict[str, int] = {}  # {종목코드: 테이블 행 번호}
+        self._dirty_codes: set = set()  # 잔고/수익률 재조회가 필요한 종목코드
+        self._config_dirty = False  # 마지막 저장/불러오기 이후 strategy_data 변경 여부
+        self._creon_started = False  # 첫 표시 후 크레온 연결을 시작했는지 여부
         self.creon = CreonManager()
         self.trading_manager = None
 
         self._build_ui()
         self._setup_connections()
         
-        self.trading_manager = TradingManager(self.creon, self.status_panel, self.refresh_prices_for_code)
-
-        self.connect_creon()
-        # <<< [추가] 크레온 연결 후 실시간 시그널 연결
-        if self.creon.is_initialized:
-            self.creon.ui_update_signal.connect(self.update_row_from_realtime)
-
-        self.load_config() 
+        # 잔고/수익률 갱신 요청은 바로 조회하지 않고 DIRTY_REFRESH_DELAY_MS 동안 모아서 한 번에 처리
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(self.DIRTY_REFRESH_DELAY_MS)
+        self._dirty_timer.timeout.connect(self._flush_dirty_codes)
+
+        # 현재가/잔고 조회 전용 스레드 (1개) – 요청 순서대로 처리되고, 스레드별 COM 객체를 재사용하도록 만료시키지 않음
+        self._quote_pool = QThreadPool(self)
+        self._quote_pool.setMaxThreadCount(1)
+        self._quote_pool.setExpiryTimeout(-1)
+
+        self.trading_manager = TradingManager(self.creon, self.status_panel, self.mark_dirty)
+
+        # <<< [추가] 크레온 연결 후 실시간 틱을 주기적으로 묶어서 화면에 반영
+        self._realtime_ui_timer = QTimer(self)
+        self._realtime_ui_timer.setInterval(self.REALTIME_UI_INTERVAL_MS)
+        self._realtime_ui_timer.timeout.connect(self._flush_realtime_ui)
+
+        # 연결은 창이 처음 표시된 뒤(showEvent) 시작되고, 설정 불러오기는 연결 결과가 나온 뒤(_on_creon_connected) 수행
+        self.creon.connected.connect(self._on_creon_connected)
         self.status_panel.add_log("프로그램이 시작되었습니다.", "INFO")
 
-    # <<< [추가] 실시간 데이터로 UI의 특정 행을 업데이트하는 메소드
-    def update_row_from_realtime(self, data: dict):
-        code = data.get("code")
-        if not code: return
-        
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 1) and self.table.item(row, 1).text() == code:
-                # 현재가 업데이트
-                # [수정] current_price가 None 타입으로 들어오는 경우를 대비한 방어 코드 추가
-                current_price = data.get("current_price") 
-                if current_price is None:
-                    current_price = 0 # None일 경우 0으로 처리하여 에러 방지
-
-                price_item = QTableWidgetItem(f"{current_price:,}")
-                price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                self.table.setItem(row, 3, price_item)
-
-                # 수익률 실시간 계산 및 업데이트
-                try:
-                    # [수정] avg_price를 가져오기 전에 item 존재 여부 확인
-                    avg_price_item = self.table.item(row, 4) # 잔고(수량)가 아닌 평단가가 필요합니다. TradingWorker의 평단가를 사용합니다.
-                    worker = self.trading_manager.workers.get(code)
-                    avg_price = worker.avg_buy_price if worker else 0
-                    
-                    balance_str = self.table.item(row, 4).text().replace(",", "") if self.table.item(row, 4) else "0"
-                    balance = int(balance_str) if balance_str else 0
-                    
-                    if balance > 0 and avg_price > 0:
-                        pnl = ((current_price - avg_price) / avg_price) * 100
-                    else:
-                        pnl = 0.0
-
-                    pnl_item = QTableWidgetItem(f"{pnl:+.2f}%")
-                    # [수정] 수익률에 따라 색상 변경 (가독성 향상)
-                    if pnl > 0:
-                        pnl_item.setForeground(QColor("#dc3545")) # Red for profit
-                    elif pnl < 0:
-                        pnl_item.setForeground(QColor("#0d7377")) # Blue for loss
-                    else:
-                        pnl_item.setForeground(QColor("#ffffff")) # White for neutral
-
-                    pnl_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    self.table.setItem(row, 5, pnl_item)
-                except Exception:
-                    # 수익률 계산 중 오류가 발생해도 프로그램이 멈추지 않도록 예외 처리
-                    pass 
-                
-                # 찾았으므로 루프 종료
-                return
-
-    def on_delete_clicked(self):
-        btn = self.sender()
-        if not isinstance(btn, QPushButton):
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._creon_started:
+            self._creon_started = True
+            QTimer.singleShot(0, self.connect_creon)
+
+    def _flush_realtime_ui(self):
+        """마지막 반영 이후 들어온 종목별 최신 틱을 한 번에 테이블에 반영합니다."""
+        # 화면에 보이지 않으면 반영하지 않음 – 대기 틱은 종목별 최신값으로 계속 덮어써지므로
+        # 다시 보이게 되면 다음 타이머 주기에 한 번에 따라잡음
+        if self.isMinimized() or not self.table.isVisible():
             return
-
-        # 버튼이 들어 있는 행 번호 찾기 (컨테이너 QFrame의 자식까지 탐색)
-        target_row = -1
-        for row in range(self.table.rowCount()):
-            cell_widget = self.table.cellWidget(row, 8)
-            if cell_widget:
-                for child in cell_widget.children():
-                    if child is btn:
-                        target_row = row
-                        break
-            if target_row != -1:
-                break
-
-        if target_row < 0:
+        pending = self.creon.take_pending_ui()
+        if not pending:
             return
+        # 바뀐 셀의 다시 그리기 요청은 Qt가 다음 도색 때 합쳐서 처리함
+        for code, tick in pending.items():
+            self.update_row_from_realtime(
+                code, tick.current_price or 0, tick.high_price or 0,
+                tick.low_price or 0, tick.volume or 0,
+                tick.trade_value or 0, tick.tick_time or 0,
+            )
 
-        self.remove_symbol_row(target_row)
+    # <<< [추가] 실시간 데이터로 UI의 특정 행을 업데이트하는 메소드
+    def update_row_from_realtime(self, code: str, current_price: int, high_price: int, low_price: int,
+                                 volume: int, trade_value: int, tick_time: int):
+        row = self._row_by_code.get(code) if code else None
+        if row is None: return
+
+        # 수익률 실시간 계산 (평단가는 TradingWorker의 값을 사용, 잔고/평단가가 없으면 None(계산 전))
+        balance = self.model.qtys[row]
+        worker = self.trading_manager.workers.get(code)
+        avg_price = worker.avg_buy_price if worker else 0
+        if balance > 0 and avg_price > 0:
+            pnl = ((current_price - avg_price) / avg_price) * 100
+        else:
+            pnl = None
+
+        # 현재가/수익률 업데이트 (수익률 색상은 모델이 부호에 따라 결정)
+        self.model.set_quote(row, current_price, balance, pnl)
 
     def remove_symbol_row(self, row):
-        if row < 0 or row >= self.table.rowCount(): return
+        if row < 0 or row >= self.model.rowCount(): return
 
-        code = self.table.item(row, 1).text()
-        name = self.table.item(row, 2).text()
+        code = self.model.codes[row]
+        name = self.model.names[row]
         
         reply = QMessageBox.question(self, '종목 삭제 확인', f'\'{name}({code})\' 종목을 목록에서 삭제하시겠습니까?',
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -1531,15 +2309,21 @@ class MainWindow(QMainWindow):
             del self.trading_manager.workers[code]
             self.status_panel.add_log(f"'{name}' 종목의 자동매매가 중지되고 구독이 해지되었습니다.", "INFO")
 
-        self.table.removeRow(row)
+        self.model.remove_row(row)
+        # 삭제된 행 뒤의 행 번호를 하나씩 당김
+        del self._row_by_code[code]
+        for c, r in self._row_by_code.items():
+            if r > row:
+                self._row_by_code[c] = r - 1
         if code in self.strategy_data:
             del self.strategy_data[code]
+            self._config_dirty = True
 
         if self.current_code == code:
             self.current_code = None
             self.section_buy.clear_all()
             self.section_sell.clear_all()
-            self.lbl_stock.setText('<h2><i style="color:#aaa;">종목을 선택하세요</i></h2>')
+            self._show_stock_header(None)
             
         self.status_panel.add_log(f"종목 '{name}'이(가) 삭제되었습니다.", "WARN")
 
@@ -1584,14 +2368,17 @@ class MainWindow(QMainWindow):
  
         left_layout.addLayout(btn_layout)
         
-        self.table = QTableWidget(0, 9)
-        headers = ["ON", "코드", "종목명", "현재가", "잔고", "수익률", "매수", "매도", "삭제"]
-        self.table.setHorizontalHeaderLabels(headers)
+        self.model = SymbolTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)
         header.setSectionResizeMode(1, QHeaderView.Fixed)
         header.setSectionResizeMode(2, QHeaderView.Stretch) 
+        # 현재가/잔고/수익률 열은 고정 폭 – 내용 길이에 따라 폭을 다시 계산하지 않음
+        for col in (SymbolTableModel.COL_PRICE, SymbolTableModel.COL_QTY, SymbolTableModel.COL_PNL):
+            header.setSectionResizeMode(col, QHeaderView.Fixed)
         
         self.table.setColumnWidth(0, 40)
         self.table.setColumnWidth(1, 100)
@@ -1601,10 +2388,23 @@ class MainWindow(QMainWindow):
         self.table.setColumnWidth(6, 60)
         self.table.setColumnWidth(7, 60)
         self.table.setColumnWidth(8, 50)
+
+        # ON/매수/매도 체크 열은 위젯 대신 델리게이트로 그림 (ON: 기본 체크박스, 매수: 녹색, 매도: 빨간색)
+        self._check_delegates = {
+            SymbolTableModel.COL_ON: CheckBoxDelegate(16, "#0d7377", "#14a085", 1, self.table),
+            SymbolTableModel.COL_BUY: CheckBoxDelegate(20, "#28a745", "#1e7e34", 2, self.table),
+            SymbolTableModel.COL_SELL: CheckBoxDelegate(20, "#dc3545", "#b21f2d", 2, self.table),
+        }
+        for col, delegate in self._check_delegates.items():
+            self.table.setItemDelegateForColumn(col, delegate)
+        # 삭제 버튼 열: 행마다 버튼을 만들지 않고 델리게이트 하나에서 클릭을 받아 처리
+        self._delete_delegate = DeleteButtonDelegate(self.table)
+        self._delete_delegate.delete_requested.connect(self.remove_symbol_row)
+        self.table.setItemDelegateForColumn(8, self._delete_delegate)
         
-        self.table.setAlternatingRowColors(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setAlternatingRowColors(False)  # 줄무늬는 모델의 BackgroundRole로 처리
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         left_layout.addWidget(self.table)
          
@@ -1626,8 +2426,26 @@ class MainWindow(QMainWindow):
         right_widget = QWidget()
         right_layout = QVBoxLayout(right_widget)
         
-        self.lbl_stock = QLabel('<h2><i style="color:#aaa;">종목을 선택하세요</i></h2>')
-        right_layout.addWidget(self.lbl_stock)
+        # 선택 종목 표시: HTML 대신 일반 텍스트 라벨을 쓰고 글꼴/색상은 여기서 한 번만 지정
+        stock_header = QHBoxLayout()
+        self.lbl_stock_hint = QLabel("종목을 선택하세요")
+        self.lbl_name = QLabel()
+        self.lbl_code = QLabel()
+        for lbl in (self.lbl_stock_hint, self.lbl_name, self.lbl_code):
+            lbl.setTextFormat(Qt.PlainText)
+            stock_header.addWidget(lbl, 0, Qt.AlignBottom)
+        stock_header.addStretch()
+        title_font = QFont(self.lbl_name.font())
+        title_font.setPointSize(15)
+        title_font.setBold(True)
+        self.lbl_name.setFont(title_font)
+        hint_font = QFont(title_font)
+        hint_font.setItalic(True)
+        self.lbl_stock_hint.setFont(hint_font)
+        self.lbl_stock_hint.setStyleSheet("color: #aaa;")
+        self.lbl_code.setStyleSheet("font-size: 12pt; color: #aaa;")
+        self._show_stock_header(None)
+        right_layout.addLayout(stock_header)
         
         tab_widget = QTabWidget()
         
@@ -1653,102 +2471,70 @@ class MainWindow(QMainWindow):
         return right_widget
 
     def _setup_connections(self):
-        self.table.cellClicked.connect(self.on_row_selected)
+        self.table.clicked.connect(lambda index: self.on_row_selected(index.row(), index.column()))
+        self.model.check_toggled.connect(self.on_checkbox_changed)
         self.btn_add_symbol.clicked.connect(self.add_symbol_dialog)
         self.btn_refresh.clicked.connect(self.refresh_prices)
  
-    def _make_centered_checkbox(self, checked: bool):
-        chk = QCheckBox()
-        chk.setChecked(checked)
-
-        container = QFrame()
-        # ★ 컨테이너가 셀 크기에 맞춰 늘어나도록
-        container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        # ★ 가로·세로 중앙 정렬
-        layout.setAlignment(Qt.AlignCenter)
-        layout.addWidget(chk)
-
-        chk.stateChanged.connect(self.on_checkbox_changed)
-        return container, chk
-
     def connect_creon(self):
         self.status_panel.add_log("크레온 API 연결을 시도합니다...", "INFO")
-        is_connected = self.creon.initialize()
+        self.status_panel.lbl_connection_status.setText("🟡 연결 중")
+        self.creon.initialize_async()
+
+    def _on_creon_connected(self, is_connected: bool, account: str):
         if is_connected:
             self.status_panel.lbl_connection_status.setText("🟢 연결됨")
-            self.status_panel.add_log(f"크레온 연결 성공. (계좌: {self.creon.account})", "SUCCESS")
+            self.status_panel.add_log(f"크레온 연결 성공. (계좌: {account})", "SUCCESS")
+            self._realtime_ui_timer.start()
         else:
             self.status_panel.lbl_connection_status.setText("🔴 미연결")
             self.status_panel.add_log("크레온 연결에 실패했습니다. 크레온 플러스가 실행 중인지 확인하세요.", "ERROR")
+        self.load_config()
 
     def add_symbol_row(self, data, configs=None):
-        row_pos = self.table.rowCount()
-        self.table.insertRow(row_pos)
         is_on, code, name, price, balance, pnl, buy_flag, sell_flag = data
-        cell_widget, chk = self._make_centered_checkbox(is_on)
-        self.table.setCellWidget(row_pos, 0, cell_widget)
-        self.table.setItem(row_pos, 1, QTableWidgetItem(code))
-        self.table.setItem(row_pos, 2, QTableWidgetItem(name))
-        self.table.setItem(row_pos, 3, QTableWidgetItem(str(price)))
-        self.table.setItem(row_pos, 4, QTableWidgetItem(str(balance)))
-        self.table.setItem(row_pos, 5, QTableWidgetItem(str(pnl)))
-        for col in [1, 3, 4, 5]: self.table.item(row_pos, col).setTextAlignment(Qt.AlignCenter)
-        buy_container, buy_chk = self._make_centered_checkbox(buy_flag); buy_chk.setProperty("class", "buy_toggle"); self.table.setCellWidget(row_pos, 6, buy_container)
-        sell_container, sell_chk = self._make_centered_checkbox(sell_flag); sell_chk.setProperty("class", "sell_toggle"); self.table.setCellWidget(row_pos, 7, sell_container)
-        btn_del = QPushButton("➖")
-        btn_del.setProperty("class", "delete")
-        btn_del.setFixedSize(28, 28)
-        btn_del.setToolTip("종목 삭제")
-        btn_del.clicked.connect(self.on_delete_clicked)
-
-        del_container = QFrame()
-        # 컨테이너가 셀 크기에 맞춰 늘어나도록
-        del_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-
-        del_layout = QHBoxLayout(del_container)
-        del_layout.setContentsMargins(0, 0, 0, 0)
-        # 가로·세로 중앙 정렬
-        del_layout.setAlignment(Qt.AlignCenter)
-        del_layout.addWidget(btn_del)
-
-        self.table.setCellWidget(row_pos, 8, del_container)
+        row_pos = self.model.add_row(code, name, price, balance, pnl, is_on, buy_flag, sell_flag)
+        self._row_by_code[code] = row_pos
         if code not in self.strategy_data:
             self.strategy_data[code] = configs if configs else {"buy": [], "sell": [], "on": is_on, "buy_flag": buy_flag, "sell_flag": sell_flag}
+            self._config_dirty = True
 
-    def on_checkbox_changed(self):
-        widget = self.sender()
-        if not isinstance(widget, QCheckBox): return
-        for row in range(self.table.rowCount()):
-            for col in [0, 6, 7]:
-                cell_widget = self.table.cellWidget(row, col)
-                if cell_widget and widget in cell_widget.children():
-                    code = self.table.item(row, 1).text()
-                    if code not in self.strategy_data: return
-                    key = {0: "on", 6: "buy_flag", 7: "sell_flag"}[col]
-                    self.strategy_data[code][key] = widget.isChecked()
-                    return
+    def on_checkbox_changed(self, code: str, key: str, checked: bool):
+        if code not in self.strategy_data: return
+        self.strategy_data[code][key] = checked
+        self._config_dirty = True
 
     def save_current_strategies(self):
         if self.current_code and self.current_code in self.strategy_data:
-            self.strategy_data[self.current_code]["buy"] = self.section_buy.get_configs()
-            self.strategy_data[self.current_code]["sell"] = self.section_sell.get_configs()
+            data = self.strategy_data[self.current_code]
+            buy, sell = self.section_buy.get_configs(), self.section_sell.get_configs()
+            if data.get("buy") != buy or data.get("sell") != sell:
+                data["buy"], data["sell"] = buy, sell
+                self._config_dirty = True
     
     def load_strategies(self, code):
         data = self.strategy_data.get(code)
         if not data: 
             self.section_buy.clear_all(); self.section_sell.clear_all(); return
         self.section_buy.set_configs(data.get("buy", [])); self.section_sell.set_configs(data.get("sell", []))
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row < 0: return
-        name = self.table.item(current_row, 2).text()
-        self.lbl_stock.setText(f'<h2>{name} <span style="font-size: 12pt; color: #aaa;">({code})</span></h2>')
+        self._show_stock_header(self.model.names[current_row], code)
+
+    def _show_stock_header(self, name: Optional[str], code: str = ""):
+        """선택 종목의 이름/코드를 표시합니다. name이 None이면 안내 문구를 표시합니다."""
+        selected = name is not None
+        self.lbl_stock_hint.setVisible(not selected)
+        self.lbl_name.setVisible(selected)
+        self.lbl_code.setVisible(selected)
+        if selected:
+            self.lbl_name.setText(name)
+            self.lbl_code.setText(f"({code})")
 
     def on_row_selected(self, row, col):
-        if col == 8 or row < 0: return
-        code = self.table.item(row, 1).text()
+        # 체크/삭제 열 클릭은 행 선택으로 처리하지 않음 (기존 셀 위젯 동작과 동일)
+        if col == 8 or col in SymbolTableModel.CHECK_KEYS or row < 0: return
+        code = self.model.codes[row]
         if code == self.current_code: return
         self.save_current_strategies()
         self.current_code = code
@@ -1761,95 +2547,90 @@ class MainWindow(QMainWindow):
 
         code = AddSymbolDialog.get_code(self.creon, self)
         if code:
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 1).text() == code:
-                    QMessageBox.warning(self, "중복 종목", f"'{self.creon.get_stock_name(code)}' 종목은 이미 목록에 있습니다.")
-                    return
-
             stock_name = self.creon.get_stock_name(code)
-            stock_info = self.creon.get_stock_info(code)
-
-            # [수정] stock_info.get('price', ...) -> stock_info.get('current_price', ...) 로 키 이름 변경
-            current_price_val = stock_info.get('current_price', 0) if stock_info else 0
-            current_price = f"{current_price_val:,}"
+            if code in self._row_by_code:
+                QMessageBox.warning(self, "중복 종목", f"'{stock_name}' 종목은 이미 목록에 있습니다.")
+                return
 
+            # 현재가는 아래의 잔고/수익률 갱신(백그라운드 조회)에서 함께 채워짐
             new_data = (
                 True,            # is_active
                 code,            # 종목코드
                 stock_name,      # 종목명
-                current_price,   # 현재가
-                "0",             # 잔고 (초기값)
-                "0.00%",         # 수익률 (초기값)
+                0,               # 현재가 (조회 전)
+                0,               # 잔고 (초기값)
+                None,            # 수익률 (초기값, 0.00% 표시)
                 True,            # 자동매수
                 True             # 자동매도
             )
             self.add_symbol_row(new_data)
-            self.table.setCurrentCell(self.table.rowCount() - 1, 0)
-            self.on_row_selected(self.table.rowCount() - 1, 0)
+            last_row = self.model.rowCount() - 1
+            self.table.setCurrentIndex(self.model.index(last_row, 0))
+            self.on_row_selected(last_row, SymbolTableModel.COL_CODE)
 
             # 종목 추가 후 바로 잔고/수익률을 갱신하여 정확한 정보를 표시
             self.refresh_prices_for_code(code)
 
     def refresh_prices_for_code(self, code: str):
-        """특정 종목 코드의 잔고, 현재가, 수익률을 모두 새로고침합니다."""
+        """특정 종목 코드의 잔고, 현재가, 수익률을 백그라운드에서 새로 조회합니다."""
         if not self.creon.is_initialized: return
-        
-        row_to_update = -1
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 1) and self.table.item(row, 1).text() == code:
-                row_to_update = row
-                break
-        if row_to_update == -1: return
+        if code in self._row_by_code:
+            self._request_quotes([code])
 
-        # [개선] 1. API를 통해 잔고, 평단가, 현재가 정보를 모두 새로 조회
-        qty, avg_price = self.creon.get_stock_balance_and_avg_price(code)
-        stock_info = self.creon.get_stock_info(code)
-        cur = stock_info.get("current_price", 0) if stock_info else 0
-        
+    def _request_quotes(self, codes: List[str], full: bool = False):
+        """현재가(복수 종목 조회)와 잔고(계좌 조회)를 _quote_pool 스레드에서 조회합니다."""
+        task = QuoteFetchTask(self.creon, codes, full)
+        task.signals.finished.connect(self._on_quotes_fetched)
+        self._quote_pool.start(task)
+
+    def _on_quotes_fetched(self, codes, prices, qtys, avg_prices, full):
         # worker가 있다면 평단가 및 잔고 정보 업데이트
-        if code in self.trading_manager.workers:
-            self.trading_manager.workers[code].avg_buy_price = avg_price
-            self.trading_manager.workers[code].quantity_held = qty
-
-        # [개선] 2. 새로 조회한 정보로 테이블의 모든 관련 셀 업데이트
-        # 현재가
-        price_item = QTableWidgetItem(f"{cur:,}")
-        price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.table.setItem(row_to_update, 3, price_item)
-        
-        # 잔고
-        balance_item = QTableWidgetItem(f"{qty:,}")
-        balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.table.setItem(row_to_update, 4, balance_item)
-        
-        # 수익률
-        pnl_item = QTableWidgetItem("0.00%")
-        if qty > 0 and avg_price > 0 and cur > 0:
-            pnl = ((cur - avg_price) / avg_price) * 100
-            pnl_item = QTableWidgetItem(f"{pnl:+.2f}%")
+        workers = self.trading_manager.workers
+        for code, qty, avg_price in zip(codes, qtys, avg_prices):
+            worker = workers.get(code)
+            if worker is not None:
+                worker.avg_buy_price = avg_price
+                worker.quantity_held = qty
+
+        if full and codes == self.model.codes:
+            self.model.set_quotes(prices, qtys, avg_prices)
         else:
-            pnl_item = QTableWidgetItem("0.00%")
+            # 조회 중에 종목이 추가/삭제되었을 수 있으므로 행 번호는 반영 시점에 다시 찾음
+            for code, cur, qty, avg_price in zip(codes, prices, qtys, avg_prices):
+                row = self._row_by_code.get(code)
+                if row is None: continue
+                pnl = ((cur - avg_price) / avg_price) * 100 if qty > 0 and avg_price > 0 and cur > 0 else None
+                self.model.set_quote(row, cur, qty, pnl)
+        if full:
+            self.status_panel.add_log("전체 잔고/수익률 갱신 완료", "SUCCESS")
+
+    def mark_dirty(self, code: str):
+        """잔고/수익률 재조회가 필요한 종목을 표시합니다. 실제 조회는 타이머 만료 시 한 번에 수행됩니다."""
+        self._dirty_codes.add(code)
+        # 이미 대기 중이면 타이머를 다시 시작하지 않음 – 요청이 계속 들어와도 최대 1/DIRTY_REFRESH_DELAY_MS 빈도로 처리
+        if not self._dirty_timer.isActive():
+            self._dirty_timer.start()
+
+    def _flush_dirty_codes(self):
+        codes = [c for c in self._dirty_codes if c in self._row_by_code]
+        self._dirty_codes.clear()
+        if not codes or not self.creon.is_initialized:
+            return
+        self._request_quotes(codes)
 
-        pnl_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.table.setItem(row_to_update, 5, pnl_item)
-                
     def refresh_prices(self):
         if not self.creon.is_initialized:
             QMessageBox.warning(self, "연결 오류", "Creon Plus가 연결되지 않았습니다."); return
-        total = self.table.rowCount()
+        total = self.model.rowCount()
         if total == 0: return
 
         self.status_panel.add_log(f"전체 잔고/수익률 갱신 시작 ({total}종목)", "INFO")
-        for row in range(total):
-            code = self.table.item(row, 1).text()
-            if code: self.refresh_prices_for_code(code)
-        self.status_panel.add_log("전체 잔고/수익률 갱신 완료", "SUCCESS")
+        self._request_quotes(list(self.model.codes), full=True)
 
     def start_auto_trading(self):
         self.save_current_strategies()
         codes_to_trade = []
-        for row in range(self.table.rowCount()):
-            code = self.table.item(row, 1).text()
+        for code in self.model.codes:
             stock_data = self.strategy_data.get(code)
             if stock_data and stock_data.get("on"):
                 codes_to_trade.append(code)
@@ -1868,23 +2649,39 @@ class MainWindow(QMainWindow):
 
     def save_config(self):
         self.save_current_strategies()
+        if not self._config_dirty: return
+        tmp_path = None
         try:
-            with open(self.CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.strategy_data, f, indent=4, ensure_ascii=False)
+            # 한 번에 직렬화하여 같은 폴더의 임시 파일에 쓴 뒤 교체 – 저장 도중 종료되어도 기존 설정 파일이 깨지지 않음
+            payload = _json_dumps(self.strategy_data)
+            with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(os.path.abspath(self.CONFIG_FILE)),
+                                             prefix=".user_config.", suffix=".tmp", delete=False) as f:
+                tmp_path = f.name
+                f.write(payload)
+            os.replace(tmp_path, self.CONFIG_FILE)
+            tmp_path = None
+            self._config_dirty = False
             self.status_panel.add_log(f"설정이 '{self.CONFIG_FILE}'에 저장되었습니다.", "INFO")
         except Exception as e:
             self.status_panel.add_log(f"설정 저장 실패: {e}", "ERROR")
+        finally:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def load_config(self):
         if not os.path.exists(self.CONFIG_FILE): return
         try:
-            with open(self.CONFIG_FILE, "r", encoding="utf-8") as f:
-                self.strategy_data = json.load(f)
-            self.table.setRowCount(0)
-            for code, data in self.strategy_data.items():
-                stock_name = self.creon.get_stock_name(code) or "이름 조회 실패"
-                new_row_data = (data.get("on", True), code, stock_name, "0", "0", "0.00%", data.get("buy_flag", True), data.get("sell_flag", True))
-                self.add_symbol_row(new_row_data, data)
+            with open(self.CONFIG_FILE, "rb") as f:
+                self.strategy_data = _json_loads(f.read())
+            # 행 목록은 Qt 호출 없이 먼저 만들고, 모델에는 리셋 한 번으로 반영
+            rows = [
+                (code, self.creon.get_stock_name(code) or "이름 조회 실패",
+                 data.get("on", True), data.get("buy_flag", True), data.get("sell_flag", True))
+                for code, data in self.strategy_data.items()
+            ]
+            self.model.load_bulk(rows)
+            self._row_by_code = {code: i for i, code in enumerate(self.model.codes)}
+            self._config_dirty = False
             self.status_panel.add_log(f"'{self.CONFIG_FILE}'에서 설정을 불러왔습니다.", "SUCCESS")
             self.refresh_prices() # 설정 로드 후 잔고/수익률 갱신
         except Exception as e:
@@ -1892,6 +2689,9 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event):
         self.stop_auto_trading()
+        # 대기 중인 조회는 버리고, 진행 중인 조회가 끝날 때까지만 기다림
+        self._quote_pool.clear()
+        self._quote_pool.waitForDone(2000)
         self.save_config()
         event.accept()
 